@@ -6,10 +6,10 @@ Centralized configuration management for the application.
 
 from pathlib import Path
 from typing import Final
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration settings"""
 
@@ -26,6 +26,8 @@ class AppConfig:
     # Database settings
     DB_NAME: str = "study.db"
     DB_TIMEOUT: int = 30  # seconds
+    DB_POOL_SIZE: int = 4  # pooled connections per database
+    DB_ROW_CACHE_SIZE: int = 1024  # cached user / vocabulary rows per table
 
     # SRS Algorithm settings
     SRS_MIN_EASINESS: float = 1.3
@@ -55,27 +57,23 @@ class AppConfig:
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_FILE: str = "englishstudy.log"
 
-    @property
-    def project_root(self) -> Path:
-        """Get the project root directory"""
-        return Path(__file__).parent
+    # Derived paths (computed once in __post_init__)
+    project_root: Path = field(init=False, repr=False, compare=False)
+    vocab_path: Path = field(init=False, repr=False, compare=False)
+    user_data_path: Path = field(init=False, repr=False, compare=False)
+    db_path: Path = field(init=False, repr=False, compare=False)
 
-    @property
-    def vocab_path(self) -> Path:
-        """Get the vocabulary directory path"""
-        return self.project_root / self.VOCAB_DIR
+    def __post_init__(self) -> None:
+        """Resolve derived paths and ensure the user data directory exists"""
+        project_root = Path(__file__).parent
+        user_data_path = project_root / self.USER_DATA_DIR
+        user_data_path.mkdir(parents=True, exist_ok=True)
 
-    @property
-    def user_data_path(self) -> Path:
-        """Get the user data directory path"""
-        path = self.project_root / self.USER_DATA_DIR
-        path.mkdir(parents=True, exist_ok=True)
-        return path
-
-    @property
-    def db_path(self) -> Path:
-        """Get the database file path"""
-        return self.user_data_path / self.DB_NAME
+        # Frozen dataclass: bypass the generated __setattr__
+        object.__setattr__(self, "project_root", project_root)
+        object.__setattr__(self, "vocab_path", project_root / self.VOCAB_DIR)
+        object.__setattr__(self, "user_data_path", user_data_path)
+        object.__setattr__(self, "db_path", user_data_path / self.DB_NAME)
 
 
 # Global configuration instance
@@ -91,22 +89,25 @@ class UserLevel:
     CET4 = "cet4"              # 四级
     CET6 = "cet6"              # 六级
 
+    _ALL = (ELEMENTARY, MIDDLE, HIGH, CET4, CET6)
+
+    _DISPLAY_NAMES = {
+        ELEMENTARY: "小学",
+        MIDDLE: "初中",
+        HIGH: "高中",
+        CET4: "大学英语四级",
+        CET6: "大学英语六级",
+    }
+
     @classmethod
-    def all(cls) -> list:
+    def all(cls) -> list[str]:
         """Get all available levels"""
-        return [cls.ELEMENTARY, cls.MIDDLE, cls.HIGH, cls.CET4, cls.CET6]
+        return list(cls._ALL)  # Copy, so callers may modify it
 
     @classmethod
     def display_name(cls, level: str) -> str:
         """Get display name for a level"""
-        names = {
-            cls.ELEMENTARY: "小学",
-            cls.MIDDLE: "初中",
-            cls.HIGH: "高中",
-            cls.CET4: "大学英语四级",
-            cls.CET6: "大学英语六级",
-        }
-        return names.get(level, level)
+        return cls._DISPLAY_NAMES.get(level, level)
 
 
 # MemoryStatus enum for convenience
@@ -117,18 +118,21 @@ class MemoryStatus:
     MEDIUM = "medium"      # 模糊
     HARD = "hard"          # 不认识
 
+    _ALL = (UNKNOWN, EASY, MEDIUM, HARD)
+
+    _DISPLAY_NAMES = {
+        UNKNOWN: "未学习",
+        EASY: "认识",
+        MEDIUM: "模糊",
+        HARD: "不认识",
+    }
+
     @classmethod
-    def all(cls) -> list:
+    def all(cls) -> list[str]:
         """Get all available statuses"""
-        return [cls.UNKNOWN, cls.EASY, cls.MEDIUM, cls.HARD]
+        return list(cls._ALL)  # Copy, so callers may modify it
 
     @classmethod
     def display_name(cls, status: str) -> str:
         """Get display name for a status"""
-        names = {
-            cls.UNKNOWN: "未学习",
-            cls.EASY: "认识",
-            cls.MEDIUM: "模糊",
-            cls.HARD: "不认识",
-        }
-        return names.get(status, status)
+        return cls._DISPLAY_NAMES.get(status, status)
@@ -9,16 +9,13 @@ import sys
 import logging
 from pathlib import Path
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-
 from config import config
-from src.ui.main_window import MainWindow
-from src.infrastructure.logger import Logger, get_logger
 
 
 def setup_logging():
     """Setup application logging"""
+    from src.infrastructure.logger import Logger
+
     log_file = config.user_data_path / config.LOG_FILE
     Logger.setup(
         log_file=str(log_file),
@@ -30,12 +27,19 @@ def main():
     """Main application entry point"""
     # Setup logging
     setup_logging()
+
+    from src.infrastructure.logger import get_logger
     logger = get_logger(__name__)
 
     logger.info("=" * 60)
     logger.info(f"Starting {config.APP_NAME} v{config.VERSION}")
     logger.info("=" * 60)
 
+    # Qt is imported only once logging is ready, so plain imports of this
+    # module (tests, tooling) never load the Qt shared libraries
+    from PyQt6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+
     # Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName(config.APP_NAME)
@@ -54,6 +58,9 @@ def main():
     # Run application
     exit_code = app.exec()
 
+    # Close pooled database connections
+    main_window.db.close_all()
+
     logger.info(f"Application exiting with code {exit_code}")
     return exit_code
 
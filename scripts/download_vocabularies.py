@@ -2,13 +2,23 @@
 下载开源词库并转换格式
 从 KyleBing/english-vocabulary GitHub 仓库下载词汇数据
 """
+import gzip
+import http.client
 import json
+import os
 import sys
 import io
-import urllib.request
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson  # 可选依赖: 更快的 JSON 解析
+except ImportError:
+    orjson = None
+
 # 设置 stdout 为 UTF-8 编码
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
@@ -37,6 +47,37 @@ VOCABULARY_FILES = {
 # 基础 URL
 BASE_URL = "https://raw.githubusercontent.com/KyleBing/english-vocabulary/master/json_original/json-simple/"
 
+# 请求头: 保持连接并接受 gzip 压缩
+REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+}
+
+# 解析后的基础 URL (host + path 前缀)
+_BASE_URL_PARTS = urllib.parse.urlsplit(BASE_URL)
+
+# 每个下载线程复用自己的 HTTPS 连接
+_thread_local = threading.local()
+
+# 复用的 JSON 解码器 (未安装 orjson 时使用)
+_JSON_DECODER = json.JSONDecoder()
+
+# 读取 meta 时预读的字符数
+META_PEEK_CHARS = 4096
+
+# 并发下载线程数
+MAX_DOWNLOAD_WORKERS = 8
+
+# 多线程下载时保护 print 输出不交错
+_print_lock = threading.Lock()
+
+
+def safe_print(*args, **kwargs):
+    """线程安全的 print"""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
 # 难度映射
 DIFFICULTY_MAP = {
     "elementary": 3,
@@ -45,8 +86,8 @@ DIFFICULTY_MAP = {
     "cet6": 7,
 }
 
-# 分类映射 (根据词性推测)
-CATEGORY_MAP = {
+# 分类映射 (根据词性推测)，值预先驻留，所有单词共享同一个字符串对象
+CATEGORY_MAP = {k: sys.intern(v) for k, v in {
     "n": "noun",
     "v": "verb",
     "adj": "adjective",
@@ -57,26 +98,82 @@ CATEGORY_MAP = {
     "interj": "interjection",
     "num": "numeral",
     "art": "article",
-}
+}.items()}
+
+DEFAULT_CATEGORY = sys.intern("noun")
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    """获取当前线程的 HTTPS 连接 (Keep-Alive 复用)"""
+    connection = getattr(_thread_local, "connection", None)
+    if connection is None:
+        connection = http.client.HTTPSConnection(_BASE_URL_PARTS.netloc, timeout=30)
+        _thread_local.connection = connection
+    return connection
+
+
+def _drop_connection():
+    """关闭并丢弃当前线程的连接"""
+    connection = getattr(_thread_local, "connection", None)
+    if connection is not None:
+        connection.close()
+        _thread_local.connection = None
+
+
+def fetch_bytes(file_name: str) -> bytes:
+    """通过复用的连接下载文件内容 (自动解压 gzip)"""
+    path = _BASE_URL_PARTS.path + file_name
+
+    # 服务器可能已关闭空闲连接，此时重新建立连接再试一次
+    for attempt in range(2):
+        connection = _get_connection()
+        try:
+            connection.request("GET", path, headers=REQUEST_HEADERS)
+            response = connection.getresponse()
+            body = response.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionError):
+            _drop_connection()
+            if attempt == 1:
+                raise
+        except Exception:
+            _drop_connection()
+            raise
+
+    if response.status != 200:
+        raise OSError(f"HTTP {response.status} {response.reason}")
+
+    if response.getheader("Content-Encoding", "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return body
 
 
 def download_json(file_name: str) -> List[Dict[str, Any]]:
     """下载单个 JSON 文件"""
     url = BASE_URL + file_name
-    print(f"正在下载: {url}")
+    safe_print(f"正在下载: {url}")
 
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            print(f"  ✓ 成功获取 {len(data)} 个单词")
-            return data
+        body = fetch_bytes(file_name)
+        # 直接解析响应字节，orjson 可省去 decode 字符串副本
+        if orjson is not None:
+            data = orjson.loads(body)
+        else:
+            data = _JSON_DECODER.decode(body.decode('utf-8'))
+        safe_print(f"  ✓ {file_name}: 成功获取 {len(data)} 个单词")
+        return data
     except Exception as e:
-        print(f"  ✗ 下载失败: {e}")
+        safe_print(f"  ✗ {file_name}: 下载失败: {e}")
         return []
 
 
-def convert_word(source_word: Dict[str, Any], level: str) -> Dict[str, Any]:
-    """将源格式转换为目标格式"""
+def convert_word(source_word: Dict[str, Any], difficulty: int) -> Dict[str, Any]:
+    """将源格式转换为目标格式
+
+    Args:
+        source_word: 源词条
+        difficulty: 该等级的难度 (由调用方按等级预先查好)
+    """
     word = source_word.get("word", "")
 
     # 获取翻译和词性
@@ -93,34 +190,33 @@ def convert_word(source_word: Dict[str, Any], level: str) -> Dict[str, Any]:
             trans = t.get("translation", "")
             pos = t.get("type", "")
             if trans:
-                all_translations.append(f"{cn_translation}")
+                all_translations.append(f"{pos}. {trans}" if pos else trans)
         definition = "; ".join(all_translations) if all_translations else cn_translation
 
         # 映射词性到我们的分类
-        category = CATEGORY_MAP.get(pos_type.lower(), "noun")
+        # 词性通常已是小写，命中时省去 lower()
+        category = CATEGORY_MAP.get(pos_type) or CATEGORY_MAP.get(pos_type.lower(), DEFAULT_CATEGORY)
     else:
         definition = ""
-        category = "noun"
+        category = DEFAULT_CATEGORY
 
     # 构建例句 (从短语中选择一个)
     phrases = source_word.get("phrases", [])
     if phrases:
         phrase_obj = phrases[0]
-        example = f"{phrase_obj.get('phrase', '')} - {phrase_obj.get('translation', '')}"
+        example = phrase_obj.get('phrase', '') + " - " + phrase_obj.get('translation', '')
     else:
         example = f"Learn the word: {word}."
 
-    # 获取难度和频率
-    difficulty = DIFFICULTY_MAP.get(level, 5)
     frequency = 3  # 默认频率
 
     # 生成简单音标 (模拟)
-    phonetic = f"/{word}/"
+    phonetic = "/" + word + "/"
 
     return {
         "word": word,
         "phonetic": phonetic,
-        "definition": f"{definition}",
+        "definition": definition,
         "example": example,
         "difficulty": difficulty,
         "frequency": frequency,
@@ -128,24 +224,99 @@ def convert_word(source_word: Dict[str, Any], level: str) -> Dict[str, Any]:
     }
 
 
-def process_level(level_name: str, source_files: List[str], output_dir: Path):
-    """处理单个等级的词汇"""
+def write_json(file_path: Path, data: Dict[str, Any]):
+    """将数据写入 JSON 文件 (有 orjson 时一次性写出字节)"""
+    # 先写临时文件再原子替换，中断时不会留下半截文件
+    tmp_path = file_path.with_suffix('.json.tmp')
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_word_count(file_path: Path) -> int:
+    """读取词库文件中的单词数
+
+    输出文件的 meta 位于开头，只解析文件头部的 meta 对象取 total_words；
+    头部中找不到时才回退到完整解析。
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        head = f.read(META_PEEK_CHARS)
+
+    meta_key = head.find('"meta"')
+    brace = head.find('{', meta_key) if meta_key != -1 else -1
+    if brace != -1:
+        try:
+            meta, _ = _JSON_DECODER.raw_decode(head, brace)
+            if isinstance(meta.get("total_words"), int):
+                return meta["total_words"]
+        except ValueError:
+            pass
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return len(data.get("words", []))
+
+
+def download_all(
+    vocabulary_files: Dict[str, List[str]]
+) -> Dict[str, List[List[Dict[str, Any]]]]:
+    """并发下载所有等级的词汇文件
+
+    Returns:
+        等级名 -> 按 vocabulary_files 中顺序排列的各文件单词列表
+    """
+    pairs = [
+        (level_name, index, file_name)
+        for level_name, source_files in vocabulary_files.items()
+        for index, file_name in enumerate(source_files)
+    ]
+    results = {
+        level_name: [[] for _ in source_files]
+        for level_name, source_files in vocabulary_files.items()
+    }
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(download_json, file_name): (level_name, index)
+            for level_name, index, file_name in pairs
+        }
+        for future in as_completed(futures):
+            level_name, index = futures[future]
+            results[level_name][index] = future.result()
+
+    return results
+
+
+def process_level_data(
+    level_name: str,
+    words_lists: List[List[Dict[str, Any]]],
+    output_dir: Path
+):
+    """处理单个等级的词汇 (不做网络 I/O)"""
     print(f"\n{'='*50}")
     print(f"处理 {level_name} 词汇")
     print(f"{'='*50}")
 
-    all_words = []
-    existing_words = set()
+    # 难度对整个等级不变，只查一次
+    difficulty = DIFFICULTY_MAP.get(level_name, 5)
 
-    # 下载并合并所有文件
-    for file_name in source_files:
-        words = download_json(file_name)
+    # 合并所有文件 (保持源文件顺序，去重结果可复现)
+    # dict 同时负责去重和保持插入顺序
+    seen: Dict[str, Dict[str, Any]] = {}
+    for words in words_lists:
         for word in words:
-            word_text = word.get("word", "")
-            if word_text and word_text not in existing_words:
-                converted = convert_word(word, level_name)
-                all_words.append(converted)
-                existing_words.add(word_text)
+            word_text = word.get("word")
+            if word_text and word_text not in seen:
+                seen[word_text] = convert_word(word, difficulty)
+    all_words = list(seen.values())
 
     print(f"\n总计去重后: {len(all_words)} 个单词")
 
@@ -156,9 +327,7 @@ def process_level(level_name: str, source_files: List[str], output_dir: Path):
     if output_file.exists():
         print(f"文件 {output_file.name} 已存在，跳过。")
         # 还是显示统计信息
-        with open(output_file, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-            print(f"现有文件包含 {len(existing_data.get('words', []))} 个单词")
+        print(f"现有文件包含 {read_word_count(output_file)} 个单词")
         return
 
     # 构建输出格式
@@ -182,8 +351,7 @@ def process_level(level_name: str, source_files: List[str], output_dir: Path):
     }
 
     # 保存文件
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    write_json(output_file, output_data)
 
     print(f"✓ 已保存到: {output_file}")
     print(f"  总词汇数: {len(all_words)}")
@@ -197,10 +365,13 @@ def main():
     print("开始下载并转换词库...")
     print(f"输出目录: {vocab_dir}")
 
+    # 并发下载所有文件
+    downloaded = download_all(VOCABULARY_FILES)
+
     # 处理每个等级
-    for level_name, source_files in VOCABULARY_FILES.items():
+    for level_name, words_lists in downloaded.items():
         try:
-            process_level(level_name, source_files, vocab_dir)
+            process_level_data(level_name, words_lists, vocab_dir)
         except Exception as e:
             print(f"处理 {level_name} 时出错: {e}")
             import traceback
@@ -215,10 +386,7 @@ def main():
     for level_name in VOCABULARY_FILES.keys():
         file_path = vocab_dir / f"{level_name}.json"
         if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                word_count = len(data.get("words", []))
-                print(f"  {level_name}: {word_count} 个单词")
+            print(f"  {level_name}: {read_word_count(file_path)} 个单词")
 
 
 if __name__ == "__main__":
@@ -2,82 +2,93 @@
 扩展词库脚本 - 为各个等级添加更多词汇
 """
 import json
+import mmap
+import os
+import re
 import sys
 import io
 from pathlib import Path
 
+try:
+    import orjson  # 可选依赖: 更快的 JSON 序列化
+except ImportError:
+    orjson = None
+
 # 设置 stdout 为 UTF-8 编码
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# 词条字段顺序 (下面各词表中每个元组按此顺序排列)
+WORD_FIELDS = ("word", "phonetic", "definition", "example", "difficulty", "frequency", "category")
+
 # 扩展的小学词汇 (难度 1-2)
-ELEMENTARY_WORDS = [
-    {"word": "apple", "phonetic": "/ˈæpl/", "definition": "n. 苹果", "example": "I like to eat apples.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "book", "phonetic": "/bʊk/", "definition": "n. 书", "example": "This is my book.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "cat", "phonetic": "/kæt/", "definition": "n. 猫", "example": "The cat is cute.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "dog", "phonetic": "/dɒɡ/", "definition": "n. 狗", "example": "I have a dog.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "egg", "phonetic": "/eɡ/", "definition": "n. 蛋", "example": "I eat an egg for breakfast.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "fish", "phonetic": "/fɪʃ/", "definition": "n. 鱼", "example": "Fish live in water.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "girl", "phonetic": "/ɡɜːl/", "definition": "n. 女孩", "example": "She is a nice girl.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "hat", "phonetic": "/hæt/", "definition": "n. 帽子", "example": "Wear your hat.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "ice", "phonetic": "/aɪs/", "definition": "n. 冰", "example": "The ice is cold.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "jump", "phonetic": "/dʒʌmp/", "definition": "v. 跳", "example": "Can you jump high?", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "key", "phonetic": "/kiː/", "definition": "n. 钥匙", "example": "Where is my key?", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "lion", "phonetic": "/ˈlaɪən/", "definition": "n. 狮子", "example": "The lion is strong.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "moon", "phonetic": "/muːn/", "definition": "n. 月亮", "example": "The moon is bright.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "nose", "phonetic": "/nəʊz/", "definition": "n. 鼻子", "example": "I have a small nose.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "orange", "phonetic": "/ˈɒrɪndʒ/", "definition": "n. 橙子", "example": "Oranges are sweet.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "pig", "phonetic": "/pɪɡ/", "definition": "n. 猪", "example": "The pig is pink.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "queen", "phonetic": "/kwiːn/", "definition": "n. 女王", "example": "The queen is kind.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "rain", "phonetic": "/reɪn/", "definition": "n. 雨", "example": "I like the rain.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "star", "phonetic": "/stɑːr/", "definition": "n. 星星", "example": "Look at the stars.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "tree", "phonetic": "/triː/", "definition": "n. 树", "example": "The tree is tall.", "difficulty": 1, "frequency": 5, "category": "noun"},
-    {"word": "run", "phonetic": "/rʌn/", "definition": "v. 跑", "example": "I can run fast.", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "walk", "phonetic": "/wɔːk/", "definition": "v. 走", "example": "Let's walk home.", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "play", "phonetic": "/pleɪ/", "definition": "v. 玩", "example": "Let's play games.", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "eat", "phonetic": "/iːt/", "definition": "v. 吃", "example": "I eat lunch at noon.", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "drink", "phonetic": "/drɪŋk/", "definition": "v. 喝", "example": "Drink some water.", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "sleep", "phonetic": "/sliːp/", "definition": "v. 睡觉", "example": "I sleep at night.", "difficulty": 1, "frequency": 5, "category": "verb"},
-    {"word": "happy", "phonetic": "/ˈhæpi/", "definition": "adj. 快乐的", "example": "I am happy today.", "difficulty": 1, "frequency": 5, "category": "adjective"},
-    {"word": "sad", "phonetic": "/sæd/", "definition": "adj. 伤心的", "example": "Don't be sad.", "difficulty": 1, "frequency": 5, "category": "adjective"},
-    {"word": "big", "phonetic": "/bɪɡ/", "definition": "adj. 大的", "example": "The elephant is big.", "difficulty": 1, "frequency": 5, "category": "adjective"},
-    {"word": "small", "phonetic": "/smɔːl/", "definition": "adj. 小的", "example": "The bird is small.", "difficulty": 1, "frequency": 5, "category": "adjective"},
-    {"word": "good", "phonetic": "/ɡʊd/", "definition": "adj. 好的", "example": "You are a good student.", "difficulty": 1, "frequency": 5, "category": "adjective"},
-    {"word": "bad", "phonetic": "/bæd/", "definition": "adj. 坏的", "example": "That's a bad idea.", "difficulty": 1, "frequency": 5, "category": "adjective"},
-]
+ELEMENTARY_WORDS = (
+    ("apple", "/ˈæpl/", "n. 苹果", "I like to eat apples.", 1, 5, "noun"),
+    ("book", "/bʊk/", "n. 书", "This is my book.", 1, 5, "noun"),
+    ("cat", "/kæt/", "n. 猫", "The cat is cute.", 1, 5, "noun"),
+    ("dog", "/dɒɡ/", "n. 狗", "I have a dog.", 1, 5, "noun"),
+    ("egg", "/eɡ/", "n. 蛋", "I eat an egg for breakfast.", 1, 5, "noun"),
+    ("fish", "/fɪʃ/", "n. 鱼", "Fish live in water.", 1, 5, "noun"),
+    ("girl", "/ɡɜːl/", "n. 女孩", "She is a nice girl.", 1, 5, "noun"),
+    ("hat", "/hæt/", "n. 帽子", "Wear your hat.", 1, 5, "noun"),
+    ("ice", "/aɪs/", "n. 冰", "The ice is cold.", 1, 5, "noun"),
+    ("jump", "/dʒʌmp/", "v. 跳", "Can you jump high?", 1, 5, "verb"),
+    ("key", "/kiː/", "n. 钥匙", "Where is my key?", 1, 5, "noun"),
+    ("lion", "/ˈlaɪən/", "n. 狮子", "The lion is strong.", 1, 5, "noun"),
+    ("moon", "/muːn/", "n. 月亮", "The moon is bright.", 1, 5, "noun"),
+    ("nose", "/nəʊz/", "n. 鼻子", "I have a small nose.", 1, 5, "noun"),
+    ("orange", "/ˈɒrɪndʒ/", "n. 橙子", "Oranges are sweet.", 1, 5, "noun"),
+    ("pig", "/pɪɡ/", "n. 猪", "The pig is pink.", 1, 5, "noun"),
+    ("queen", "/kwiːn/", "n. 女王", "The queen is kind.", 1, 5, "noun"),
+    ("rain", "/reɪn/", "n. 雨", "I like the rain.", 1, 5, "noun"),
+    ("star", "/stɑːr/", "n. 星星", "Look at the stars.", 1, 5, "noun"),
+    ("tree", "/triː/", "n. 树", "The tree is tall.", 1, 5, "noun"),
+    ("run", "/rʌn/", "v. 跑", "I can run fast.", 1, 5, "verb"),
+    ("walk", "/wɔːk/", "v. 走", "Let's walk home.", 1, 5, "verb"),
+    ("play", "/pleɪ/", "v. 玩", "Let's play games.", 1, 5, "verb"),
+    ("eat", "/iːt/", "v. 吃", "I eat lunch at noon.", 1, 5, "verb"),
+    ("drink", "/drɪŋk/", "v. 喝", "Drink some water.", 1, 5, "verb"),
+    ("sleep", "/sliːp/", "v. 睡觉", "I sleep at night.", 1, 5, "verb"),
+    ("happy", "/ˈhæpi/", "adj. 快乐的", "I am happy today.", 1, 5, "adjective"),
+    ("sad", "/sæd/", "adj. 伤心的", "Don't be sad.", 1, 5, "adjective"),
+    ("big", "/bɪɡ/", "adj. 大的", "The elephant is big.", 1, 5, "adjective"),
+    ("small", "/smɔːl/", "adj. 小的", "The bird is small.", 1, 5, "adjective"),
+    ("good", "/ɡʊd/", "adj. 好的", "You are a good student.", 1, 5, "adjective"),
+    ("bad", "/bæd/", "adj. 坏的", "That's a bad idea.", 1, 5, "adjective"),
+)
 
 # 扩展的高中词汇 (难度 4-6)
-HIGH_SCHOOL_WORDS = [
-    {"word": "abandon", "phonetic": "/əˈbændən/", "definition": "v. 遗弃；放弃", "example": "Don't abandon your dreams.", "difficulty": 5, "frequency": 3, "category": "verb"},
-    {"word": "benefit", "phonetic": "/ˈbenɪfɪt/", "definition": "n. 利益；好处", "example": "Exercise has many benefits.", "difficulty": 5, "frequency": 4, "category": "noun"},
-    {"word": "complex", "phonetic": "/kəmˈpleks/", "definition": "adj. 复杂的", "example": "This problem is complex.", "difficulty": 5, "frequency": 4, "category": "adjective"},
-    {"word": "decade", "phonetic": "/ˈdekeɪd/", "definition": "n. 十年", "example": "A decade has passed.", "difficulty": 5, "frequency": 3, "category": "noun"},
-    {"word": "economy", "phonetic": "/ɪˈkɒnəmi/", "definition": "n. 经济", "example": "The economy is growing.", "difficulty": 5, "frequency": 4, "category": "noun"},
-    {"word": "factor", "phonetic": "/ˈfæktər/", "definition": "n. 因素", "example": "Many factors affect success.", "difficulty": 5, "frequency": 4, "category": "noun"},
-    {"word": "generation", "phonetic": "/ˌdʒenəˈreɪʃn/", "definition": "n. 一代人；产生", "example": "Our generation faces new challenges.", "difficulty": 5, "frequency": 4, "category": "noun"},
-    {"word": "harvest", "phonetic": "/ˈhɑːrvɪst/", "definition": "n. 收获", "example": "The harvest was good this year.", "difficulty": 5, "frequency": 3, "category": "noun"},
-    {"word": "incident", "phonetic": "/ˈɪnsɪdənt/", "definition": "n. 事件", "example": "The incident was reported.", "difficulty": 5, "frequency": 3, "category": "noun"},
-    {"word": "justice", "phonetic": "/ˈdʒʌstɪs/", "definition": "n. 正义", "example": "Justice must be served.", "difficulty": 5, "frequency": 3, "category": "noun"},
-    {"word": "kernel", "phonetic": "/ˈkɜːrnl/", "definition": "n. 核心", "example": "The kernel of the argument.", "difficulty": 5, "frequency": 2, "category": "noun"},
-    {"word": "launch", "phonetic": "/lɔːntʃ/", "definition": "v. 发射；发起", "example": "They launched a new project.", "difficulty": 5, "frequency": 4, "category": "verb"},
-    {"word": "mechanism", "phonetic": "/ˈmekənɪzəm/", "definition": "n. 机制", "example": "This mechanism works well.", "difficulty": 5, "frequency": 3, "category": "noun"},
-    {"word": "negative", "phonetic": "/ˈneɡətɪv/", "definition": "adj. 负面的；消极的", "example": "Don't be negative.", "difficulty": 5, "frequency": 4, "category": "adjective"},
-    {"word": "obstacle", "phonetic": "/ˈɒbstəkl/", "definition": "n. 障碍", "example": "Overcome every obstacle.", "difficulty": 5, "frequency": 3, "category": "noun"},
-    {"word": "philosophy", "phonetic": "/fəˈlɒsəfi/", "definition": "n. 哲学", "example": "Philosophy teaches thinking.", "difficulty": 6, "frequency": 3, "category": "noun"},
-]
+HIGH_SCHOOL_WORDS = (
+    ("abandon", "/əˈbændən/", "v. 遗弃；放弃", "Don't abandon your dreams.", 5, 3, "verb"),
+    ("benefit", "/ˈbenɪfɪt/", "n. 利益；好处", "Exercise has many benefits.", 5, 4, "noun"),
+    ("complex", "/kəmˈpleks/", "adj. 复杂的", "This problem is complex.", 5, 4, "adjective"),
+    ("decade", "/ˈdekeɪd/", "n. 十年", "A decade has passed.", 5, 3, "noun"),
+    ("economy", "/ɪˈkɒnəmi/", "n. 经济", "The economy is growing.", 5, 4, "noun"),
+    ("factor", "/ˈfæktər/", "n. 因素", "Many factors affect success.", 5, 4, "noun"),
+    ("generation", "/ˌdʒenəˈreɪʃn/", "n. 一代人；产生", "Our generation faces new challenges.", 5, 4, "noun"),
+    ("harvest", "/ˈhɑːrvɪst/", "n. 收获", "The harvest was good this year.", 5, 3, "noun"),
+    ("incident", "/ˈɪnsɪdənt/", "n. 事件", "The incident was reported.", 5, 3, "noun"),
+    ("justice", "/ˈdʒʌstɪs/", "n. 正义", "Justice must be served.", 5, 3, "noun"),
+    ("kernel", "/ˈkɜːrnl/", "n. 核心", "The kernel of the argument.", 5, 2, "noun"),
+    ("launch", "/lɔːntʃ/", "v. 发射；发起", "They launched a new project.", 5, 4, "verb"),
+    ("mechanism", "/ˈmekənɪzəm/", "n. 机制", "This mechanism works well.", 5, 3, "noun"),
+    ("negative", "/ˈneɡətɪv/", "adj. 负面的；消极的", "Don't be negative.", 5, 4, "adjective"),
+    ("obstacle", "/ˈɒbstəkl/", "n. 障碍", "Overcome every obstacle.", 5, 3, "noun"),
+    ("philosophy", "/fəˈlɒsəfi/", "n. 哲学", "Philosophy teaches thinking.", 6, 3, "noun"),
+)
 
 # 扩展的六级词汇 (难度 7-9)
-CET6_WORDS = [
-    {"word": "abstract", "phonetic": "/ˈæbstrækt/", "definition": "adj. 抽象的", "example": "Truth is an abstract concept.", "difficulty": 7, "frequency": 3, "category": "adjective"},
-    {"word": "barrier", "phonetic": "/ˈbæriər/", "definition": "n. 障碍；屏障", "example": "Language can be a barrier.", "difficulty": 7, "frequency": 3, "category": "noun"},
-    {"word": "collapse", "phonetic": "/kəˈlæps/", "definition": "v. 倒塌；崩溃", "example": "The bridge may collapse.", "difficulty": 7, "frequency": 3, "category": "verb"},
-    {"word": "deteriorate", "phonetic": "/dɪˈtɪəriəreɪt/", "definition": "v. 恶化", "example": "His health deteriorated.", "difficulty": 7, "frequency": 2, "category": "verb"},
-    {"word": "elaborate", "phonetic": "/ɪˈlæbərət/", "definition": "adj. 精心制作的", "example": "An elaborate plan.", "difficulty": 7, "frequency": 3, "category": "adjective"},
-    {"word": "fabricate", "phonetic": "/ˈfæbrɪkeɪt/", "definition": "v. 捏造；制造", "example": "Don't fabricate stories.", "difficulty": 7, "frequency": 2, "category": "verb"},
-    {"word": "guarantee", "phonetic": "/ˌɡærənˈtiː/", "definition": "v. 保证", "example": "I guarantee success.", "difficulty": 7, "frequency": 4, "category": "verb"},
-    {"word": "hypothesis", "phonetic": "/haɪˈpɒθəsɪs/", "definition": "n. 假设", "example": "Test your hypothesis.", "difficulty": 7, "frequency": 2, "category": "noun"},
-    {"word": "inherent", "phonetic": "/ɪnˈhɪərənt/", "definition": "adj. 固有的；内在的", "example": "Risks are inherent.", "difficulty": 7, "frequency": 3, "category": "adjective"},
-    {"word": "jurisdiction", "phonetic": "/ˌdʒʊərɪsˈdɪkʃn/", "definition": "n. 管辖权", "example": "This is under our jurisdiction.", "difficulty": 8, "frequency": 2, "category": "noun"},
-]
+CET6_WORDS = (
+    ("abstract", "/ˈæbstrækt/", "adj. 抽象的", "Truth is an abstract concept.", 7, 3, "adjective"),
+    ("barrier", "/ˈbæriər/", "n. 障碍；屏障", "Language can be a barrier.", 7, 3, "noun"),
+    ("collapse", "/kəˈlæps/", "v. 倒塌；崩溃", "The bridge may collapse.", 7, 3, "verb"),
+    ("deteriorate", "/dɪˈtɪəriəreɪt/", "v. 恶化", "His health deteriorated.", 7, 2, "verb"),
+    ("elaborate", "/ɪˈlæbərət/", "adj. 精心制作的", "An elaborate plan.", 7, 3, "adjective"),
+    ("fabricate", "/ˈfæbrɪkeɪt/", "v. 捏造；制造", "Don't fabricate stories.", 7, 2, "verb"),
+    ("guarantee", "/ˌɡærənˈtiː/", "v. 保证", "I guarantee success.", 7, 4, "verb"),
+    ("hypothesis", "/haɪˈpɒθəsɪs/", "n. 假设", "Test your hypothesis.", 7, 2, "noun"),
+    ("inherent", "/ɪnˈhɪərənt/", "adj. 固有的；内在的", "Risks are inherent.", 7, 3, "adjective"),
+    ("jurisdiction", "/ˌdʒʊərɪsˈdɪkʃn/", "n. 管辖权", "This is under our jurisdiction.", 8, 2, "noun"),
+)
 
 
 def load_vocab(file_path: Path) -> dict:
@@ -92,23 +103,54 @@ def save_vocab(file_path: Path, vocab: dict):
     """保存词库"""
     # 更新 meta 信息
     vocab["meta"]["total_words"] = len(vocab["words"])
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(vocab, f, ensure_ascii=False, indent=2)
+    # 先写临时文件再原子替换，中断时不会留下半截文件
+    tmp_path = file_path.with_suffix('.json.tmp')
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(vocab, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(vocab, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def find_existing_words(file_path: Path, candidates: list) -> set:
+    """不解析 JSON，直接在文件字节中扫描已存在的候选单词"""
+    if not candidates or file_path.stat().st_size == 0:
+        return set()
+
+    pattern = re.compile(
+        rb'"word":\s*"(%s)"' % b"|".join(re.escape(w.encode('utf-8')) for w in candidates)
+    )
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return {m.group(1).decode('utf-8') for m in pattern.finditer(mm)}
 
 
-def extend_vocab(file_path: Path, new_words: list, level_name: str):
+def extend_vocab(file_path: Path, new_words: tuple, level_name: str):
     """扩展现有词库"""
+    # 所有候选单词都已存在时无需完整解析和重写文件
+    if file_path.exists():
+        candidates = {row[0] for row in new_words}
+        if find_existing_words(file_path, list(candidates)) == candidates:
+            print(f"✓ {file_path.name}: 没有新单词，跳过")
+            return
+
     vocab = load_vocab(file_path)
 
     # 获取现有单词的 word 集合
     existing_words = {w["word"] for w in vocab["words"]}
 
-    # 添加新单词
+    # 添加新单词 (只为新增的单词构建字典)
     added_count = 0
-    for word in new_words:
-        if word["word"] not in existing_words:
-            vocab["words"].append(word)
-            existing_words.add(word["word"])
+    for row in new_words:
+        if row[0] not in existing_words:
+            vocab["words"].append(dict(zip(WORD_FIELDS, row)))
+            existing_words.add(row[0])
             added_count += 1
 
     # 更新 meta
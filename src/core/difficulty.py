@@ -6,6 +6,7 @@ Adapts word difficulty recommendations based on user performance.
 
 import logging
 import math
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 
 from config import config
@@ -13,6 +14,21 @@ from src.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Constant for the expected score: 10^x == e^(x * ln 10),
+# so 1 / (1 + 10^(d / 400)) == 1 / (1 + e^(d * _EXP_SCALE))
+_EXP_SCALE = math.log(10.0) / 400.0  # 0.005756462732485115
+
+
+def _expected(user_rating: float, word_rating: float) -> float:
+    """ELO expected score for a user against a word rating"""
+    return 1.0 / (1.0 + math.exp((word_rating - user_rating) * _EXP_SCALE))
+
+
+@lru_cache(maxsize=64)
+def _target_offset(target_success_rate: float) -> float:
+    """Memoized rating offset 400 * log10(1/P - 1) for a target success rate"""
+    return 400 * math.log10(1 / target_success_rate - 1)
+
 
 class DifficultyAdapter:
     """
@@ -29,6 +45,8 @@ class DifficultyAdapter:
     - Rating update: Ra' = Ra + K * (Sa - P(A))
     """
 
+    __slots__ = ("initial_rating", "k_factor", "target_success_rate")
+
     # Difficulty to ELO mapping (1-10 difficulty levels)
     DIFFICULTY_TO_ELO = {
         1: 600,    # Very easy
@@ -43,8 +61,9 @@ class DifficultyAdapter:
         10: 2400,  # Very difficult
     }
 
-    # Reverse mapping for lookups
-    ELO_TO_DIFFICULTY = {v: k for k, v in DIFFICULTY_TO_ELO.items()}
+    # DIFFICULTY_TO_ELO is linear: elo = ELO_BASE + ELO_STEP * difficulty
+    ELO_BASE = 400
+    ELO_STEP = 200
 
     def __init__(
         self,
@@ -74,6 +93,13 @@ class DifficultyAdapter:
         Returns:
             ELO rating
         """
+        if type(difficulty) is int:
+            if 0 <= difficulty <= 10:
+                return _ELO_BY_DIFF[difficulty]
+            return _ELO_BY_DIFF[1] if difficulty < 0 else _ELO_BY_DIFF[10]
+
+        # Other numbers (e.g. 5.0 read from a REAL column): whole values map
+        # like ints, anything in between gets the 1000 baseline
         difficulty = max(1, min(10, difficulty))
         return float(self.DIFFICULTY_TO_ELO.get(difficulty, 1000))
 
@@ -87,17 +113,10 @@ class DifficultyAdapter:
         Returns:
             Difficulty level (1-10)
         """
-        # Find closest difficulty
-        closest_difficulty = 5
-        min_diff = float('inf')
-
-        for difficulty, difficulty_elo in self.DIFFICULTY_TO_ELO.items():
-            diff = abs(difficulty_elo - elo)
-            if diff < min_diff:
-                min_diff = diff
-                closest_difficulty = difficulty
-
-        return closest_difficulty
+        # Closest difficulty on the linear scale; exact midpoints round
+        # down to the easier level
+        difficulty = math.ceil((elo - self.ELO_BASE) / self.ELO_STEP - 0.5)
+        return 1 if difficulty < 1 else 10 if difficulty > 10 else difficulty
 
     def expected_score(self, user_rating: float, word_difficulty: int) -> float:
         """
@@ -112,9 +131,11 @@ class DifficultyAdapter:
         Returns:
             Expected success probability [0, 1]
         """
-        word_rating = self.difficulty_to_elo(word_difficulty)
-        exponent = (word_rating - user_rating) / 400
-        return 1.0 / (1.0 + pow(10, exponent))
+        if type(word_difficulty) is int and 0 <= word_difficulty <= 10:
+            word_rating = _ELO_BY_DIFF[word_difficulty]
+        else:
+            word_rating = self.difficulty_to_elo(word_difficulty)
+        return _expected(user_rating, word_rating)
 
     def update_user_rating(
         self,
@@ -140,11 +161,10 @@ class DifficultyAdapter:
         new_rating = current_rating + self.k_factor * (actual - expected)
 
         # Log significant rating changes
-        rating_change = abs(new_rating - current_rating)
-        if rating_change > 5:
+        if abs(new_rating - current_rating) > 5:
             logger.debug(
-                f"Rating change: {current_rating:.0f} -> {new_rating:.0f} "
-                f"({'+'if new_rating > current_rating else ''}{new_rating - current_rating:.1f})"
+                "Rating change: %.0f -> %.0f (%+.1f)",
+                current_rating, new_rating, new_rating - current_rating
             )
 
         return new_rating
@@ -170,10 +190,41 @@ class DifficultyAdapter:
         target = target_success_rate or self.target_success_rate
 
         # Inverse formula: Rb = Ra + 400 * log10(1/P - 1)
-        target_elo = user_rating + 400 * math.log10(1 / target - 1)
+        target_elo = user_rating + _target_offset(target)
 
         return self.elo_to_difficulty(target_elo)
 
+    def recommend_difficulty_batch(
+        self,
+        user_ratings: List[float],
+        target_success_rate: float = None
+    ) -> List[int]:
+        """
+        Recommend difficulties for many user ratings at once.
+
+        Equivalent to calling recommend_difficulty for each rating, with the
+        target offset computed once and the ELO-to-difficulty mapping inlined.
+
+        Args:
+            user_ratings: User ELO ratings
+            target_success_rate: Desired success rate (default: from config)
+
+        Returns:
+            Recommended difficulty level (1-10) for each rating
+        """
+        target = target_success_rate or self.target_success_rate
+        offset = _target_offset(target)
+        base = self.ELO_BASE
+        step = self.ELO_STEP
+        ceil = math.ceil
+
+        difficulties = []
+        for rating in user_ratings:
+            difficulty = ceil((rating + offset - base) / step - 0.5)
+            difficulties.append(1 if difficulty < 1 else 10 if difficulty > 10 else difficulty)
+
+        return difficulties
+
     def batch_update(
         self,
         current_rating: float,
@@ -189,14 +240,25 @@ class DifficultyAdapter:
         Returns:
             New user rating
         """
+        # Each update depends on the previous rating, so this stays a loop;
+        # it is inlined with locals to avoid per-result method-call overhead
+        k_factor = self.k_factor
+        scale = _EXP_SCALE
+        exp = math.exp
+        to_elo = self.difficulty_to_elo
         new_rating = current_rating
 
         for difficulty, is_correct in results:
-            new_rating = self.update_user_rating(new_rating, difficulty, is_correct)
+            if type(difficulty) is int and 0 <= difficulty <= 10:
+                word_rating = _ELO_BY_DIFF[difficulty]
+            else:
+                word_rating = to_elo(difficulty)
+            expected = 1.0 / (1.0 + exp((word_rating - new_rating) * scale))
+            new_rating += k_factor * ((1.0 if is_correct else 0.0) - expected)
 
         logger.info(
-            f"Batch update: {len(results)} results, "
-            f"rating: {current_rating:.0f} -> {new_rating:.0f}"
+            "Batch update: %d results, rating: %.0f -> %.0f",
+            len(results), current_rating, new_rating
         )
 
         return new_rating
@@ -282,7 +344,8 @@ class DifficultyAdapter:
     def should_adjust_difficulty(
         self,
         recent_results: List[bool],
-        min_samples: int = 5
+        min_samples: int = 5,
+        correct_count: Optional[int] = None
     ) -> Tuple[bool, str]:
         """
         Analyze recent performance to suggest difficulty adjustment.
@@ -290,6 +353,8 @@ class DifficultyAdapter:
         Args:
             recent_results: List of recent results (True=correct, False=incorrect)
             min_samples: Minimum samples needed for analysis
+            correct_count: Number of True entries in recent_results, if the
+                caller already tracks it (skips counting the list)
 
         Returns:
             Tuple of (should_adjust, direction)
@@ -298,7 +363,9 @@ class DifficultyAdapter:
         if len(recent_results) < min_samples:
             return False, "none"
 
-        correct_rate = sum(recent_results) / len(recent_results)
+        if correct_count is None:
+            correct_count = sum(recent_results)
+        correct_rate = correct_count / len(recent_results)
 
         # Adjust if success rate is too high or too low
         if correct_rate >= 0.9:
@@ -309,6 +376,13 @@ class DifficultyAdapter:
             return False, "none"
 
 
+# Word rating by difficulty level; index 0 repeats level 1 so that
+# out-of-range difficulty 0 clamps without a branch
+_ELO_BY_DIFF = tuple(
+    float(DifficultyAdapter.DIFFICULTY_TO_ELO[max(1, d)]) for d in range(11)
+)
+
+
 # Global difficulty adapter instance
 _difficulty_adapter_instance: Optional[DifficultyAdapter] = None
 
@@ -4,16 +4,26 @@ SM-2 Spaced Repetition System Algorithm
 Implements the SuperMemo-2 algorithm for optimized vocabulary review scheduling.
 """
 
+import heapq
 import logging
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Tuple, Optional, List
 
 from config import config
 from src.models.word_record import MemoryStatus, WordState
+from src.core.state_machine import get_state_machine
 from src.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+_next_review_key = attrgetter("next_review")
+
+# SM-2 easiness delta for each quality score q in 0..5:
+# 0.1 - (5 - q) * (0.08 + (5 - q) * 0.02)
+_EF_DELTA = tuple(0.1 - (5 - q) * (0.08 + (5 - q) * 0.02) for q in range(6))
+
 
 class SRSEngine:
     """
@@ -87,7 +97,7 @@ class SRSEngine:
 
         # Calculate new easiness factor
         new_easiness = self._update_easiness(current_easiness, quality)
-        logger.debug(f"Easiness updated: {current_easiness:.2f} -> {new_easiness:.2f}")
+        logger.debug("Easiness updated: %.2f -> %.2f", current_easiness, new_easiness)
 
         # Calculate new interval
         new_interval = self._calculate_interval(
@@ -96,7 +106,7 @@ class SRSEngine:
             new_easiness,
             quality
         )
-        logger.debug(f"Interval updated: {current_interval} -> {new_interval} days")
+        logger.debug("Interval updated: %s -> %s days", current_interval, new_interval)
 
         # Update repetitions
         new_repetitions = self._update_repetitions(repetitions, quality)
@@ -107,6 +117,117 @@ class SRSEngine:
 
         return new_interval, new_easiness, new_repetitions, next_review
 
+    def calculate_next_review_batch(
+        self,
+        intervals: List[int],
+        easiness: List[float],
+        repetitions: List[int],
+        feedbacks: List[MemoryStatus]
+    ) -> List[Tuple[int, float, int, datetime]]:
+        """
+        Calculate next review parameters for many words at once.
+
+        Equivalent to calling calculate_next_review for each aligned
+        (interval, easiness, repetitions, feedback) entry, with the SM-2
+        update inlined and a single timestamp shared by the whole batch.
+
+        Args:
+            intervals: Current review intervals (days)
+            easiness: Current easiness factors
+            repetitions: Current numbers of repetitions
+            feedbacks: User's memory status feedback for each word
+
+        Returns:
+            List of (new_interval, new_easiness, new_repetitions, next_review_date)
+        """
+        now = datetime.now()
+        quality_map = self.QUALITY_MAP
+        min_ef = self.min_easiness
+        max_ef = self.max_easiness
+        max_interval = self.MAX_INTERVAL_DAYS
+        first = self.FIRST_INTERVAL
+        second = self.SECOND_INTERVAL
+        # Intervals repeat heavily within a batch; reuse their review dates
+        review_dates: dict[int, datetime] = {}
+
+        results = []
+        for interval, ef, reps, feedback in zip(intervals, easiness, repetitions, feedbacks):
+            quality = quality_map.get(feedback, 0)
+
+            ef += _EF_DELTA[quality]
+            if ef < min_ef:
+                ef = min_ef
+            elif ef > max_ef:
+                ef = max_ef
+
+            if quality < 3:
+                new_interval = first
+                reps = 0
+            else:
+                if reps == 0:
+                    new_interval = first
+                elif reps == 1:
+                    new_interval = second
+                else:
+                    new_interval = min(int(interval * ef), max_interval)
+                reps += 1
+
+            next_review = review_dates.get(new_interval)
+            if next_review is None:
+                next_review = now + timedelta(days=min(new_interval, max_interval))
+                review_dates[new_interval] = next_review
+
+            results.append((new_interval, ef, reps, next_review))
+
+        return results
+
+    def update_records_batch(
+        self,
+        records: List["WordRecord"],  # type: ignore
+        feedbacks: List[MemoryStatus]
+    ) -> None:
+        """
+        Apply review feedback to many word records at once.
+
+        The SM-2 update runs over parallel interval / easiness / repetition
+        lists via calculate_next_review_batch; records are only read before
+        it and written back after it. States advance through the shared
+        WordStateMachine with each record's consecutive_count, as in
+        StudyManager.submit_answer.
+
+        Args:
+            records: Word records to update (modified in place)
+            feedbacks: User's memory status feedback for each record
+
+        Raises:
+            ValueError: If records and feedbacks differ in length
+        """
+        if len(records) != len(feedbacks):
+            raise ValueError(
+                f"Got {len(records)} records but {len(feedbacks)} feedbacks"
+            )
+
+        results = self.calculate_next_review_batch(
+            [r.interval for r in records],
+            [r.easiness for r in records],
+            [r.repetitions for r in records],
+            feedbacks
+        )
+        next_state = get_state_machine().next_state
+        now = datetime.now()
+        for record, feedback, (interval, ef, reps, next_review) in zip(records, feedbacks, results):
+            record.status = feedback
+            record.interval = interval
+            record.easiness = ef
+            record.repetitions = reps
+            record.next_review = next_review
+            record.last_review = now
+            record.state, record.consecutive_count = next_state(
+                record.state, feedback, record.consecutive_count
+            )
+
+        logger.debug("Batch review update: %d records", len(results))
+
     def _get_quality_score(self, feedback: MemoryStatus) -> int:
         """Convert MemoryStatus to quality score (0-5)"""
         return self.QUALITY_MAP.get(feedback, 0)
@@ -124,10 +245,14 @@ class SRSEngine:
         Returns:
             New easiness factor (clamped to min/max bounds)
         """
-        ef_prime = current_ef + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        ef_prime = current_ef + _EF_DELTA[quality]
 
         # Clamp to bounds
-        return max(self.min_easiness, min(ef_prime, self.max_easiness))
+        if ef_prime < self.min_easiness:
+            return self.min_easiness
+        if ef_prime > self.max_easiness:
+            return self.max_easiness
+        return ef_prime
 
     def _calculate_interval(
         self,
@@ -207,12 +332,12 @@ class SRSEngine:
             and r.state != WordState.MASTERED
         ]
 
-        # Sort by next_review date (oldest first)
-        due.sort(key=lambda r: r.next_review or datetime.min)
-
+        # Sort by next_review date (oldest first); with a limit only the
+        # oldest `limit` records are selected instead of sorting everything
         if limit is not None:
-            return due[:limit]
+            return heapq.nsmallest(limit, due, key=_next_review_key)
 
+        due.sort(key=_next_review_key)
         return due
 
     def get_new_records(
@@ -254,13 +379,24 @@ class SRSEngine:
         Returns:
             Tuple of (new_words, review_words)
         """
-        # Get due words for review
-        due_words = self.get_due_records(records, limit=max_review)
+        # Partition records into new and due buckets in a single pass
+        # (same selection as get_new_records / get_due_records)
+        now = datetime.now()
+        unknown = MemoryStatus.UNKNOWN
+        mastered = WordState.MASTERED
+        new_words = []
+        due = []
 
-        # Get new words to learn
-        new_words = self.get_new_records(records, limit=max_new)
+        for r in records:
+            if r.status == unknown and len(new_words) < max_new:
+                new_words.append(r)
+            review_at = r.next_review
+            if review_at is not None and review_at <= now and r.state != mastered:
+                due.append(r)
 
-        logger.info(f"Study queue: {len(new_words)} new, {len(due_words)} for review")
+        due_words = heapq.nsmallest(max_review, due, key=_next_review_key)
+
+        logger.info("Study queue: %d new, %d for review", len(new_words), len(due_words))
         return new_words, due_words
 
     def estimate_review_load(
@@ -279,23 +415,23 @@ class SRSEngine:
             Dictionary mapping days from now -> count of due reviews
         """
         now = datetime.now()
-        load = {}
-
-        for day in range(days_ahead + 1):
-            target_date = now + timedelta(days=day)
-            day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1)
-
-            # Count records due on this day
-            count = sum(
-                1 for r in records
-                if r.next_review is not None
-                and day_start <= r.next_review < day_end
-            )
 
-            load[day] = count
+        # Extract and sort review times once, then count each day's bucket
+        # by bisecting the day boundaries instead of rescanning all records
+        review_times = sorted(
+            r.next_review for r in records if r.next_review is not None
+        )
+
+        # Day boundaries are local midnights, derived from today's midnight
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        one_day = timedelta(days=1)
+        boundaries = [midnight + one_day * day for day in range(days_ahead + 2)]
 
-        return load
+        positions = [bisect_left(review_times, b) for b in boundaries]
+        return {
+            day: positions[day + 1] - positions[day]
+            for day in range(days_ahead + 1)
+        }
 
 
 # Global SRS engine instance
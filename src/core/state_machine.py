@@ -5,7 +5,8 @@ Manages word learning progression through different states.
 """
 
 import logging
-from typing import Dict, List, Optional, Callable
+from array import array
+from typing import Dict, List, Optional, Callable, Tuple
 from enum import Enum
 
 from src.models.word_record import WordState, MemoryStatus
@@ -13,12 +14,18 @@ from src.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Enum members in ordinal order, for decoding stored ordinals
+_STATES = tuple(WordState)
+_STATUSES = tuple(MemoryStatus)
+
 
 class StateTransition:
     """
     Represents a state transition with conditions and actions.
     """
 
+    __slots__ = ("from_state", "to_state", "feedback", "condition", "action")
+
     def __init__(
         self,
         from_state: WordState,
@@ -45,10 +52,37 @@ class StateTransition:
             self.action()
 
 
+def _transition_key(state_ord: int, feedback_ord: int) -> int:
+    """Single integer key for a (state, feedback) pair of enum ordinals"""
+    return (state_ord << 3) | feedback_ord
+
+
+def _build_transition_tables(transitions: Dict) -> Tuple[tuple, tuple]:
+    """
+    Flatten {state: {feedback: (to_state, required)}} into two flat tables.
+
+    Returns:
+        Tuple of (next_states, required_counts), both indexed by
+        _transition_key; pairs without a rule have a None next state
+    """
+    next_states = [None] * 64
+    required_counts = [None] * 64
+    for state, rules in transitions.items():
+        for feedback, (to_state, required) in rules.items():
+            key = _transition_key(state._ord, feedback._ord)
+            next_states[key] = to_state
+            required_counts[key] = required
+    return tuple(next_states), tuple(required_counts)
+
+
 class WordStateMachine:
     """
     State machine for managing word learning progression.
 
+    Consecutive EASY counts are per-word state: they are kept on the word
+    record and passed through next_state, so a single machine can serve
+    every word without shared counters.
+
     State Transitions:
         NEW --[any feedback]--> LEARNING
         LEARNING --[EASY x2]--> REVIEW
@@ -61,6 +95,8 @@ class WordStateMachine:
         MASTERED --[EASY]--> MASTERED
     """
 
+    __slots__ = ("_hist_state", "_hist_feedback", "_hist_head", "_hist_len")
+
     # State transition rules
     # Format: {from_state: {feedback: (to_state, consecutive_required)}}
     TRANSITIONS = {
@@ -86,64 +122,81 @@ class WordStateMachine:
         },
     }
 
+    # Flat lookup tables built from TRANSITIONS, indexed by
+    # (state._ord << 3) | feedback._ord
+    _NEXT, _REQ = _build_transition_tables(TRANSITIONS)
+
+    # Number of recent transitions kept in state_history
+    HISTORY_SIZE = 100
+
     def __init__(self):
         """Initialize state machine"""
-        self.consecutive_counts: Dict[WordState, int] = {
-            WordState.LEARNING: 0,
-            WordState.REVIEW: 0,
-        }
-        self.state_history: List[tuple[WordState, MemoryStatus]] = []
+        # History ring buffer: parallel arrays of state / feedback ordinals
+        self._hist_state = array('b', bytes(self.HISTORY_SIZE))
+        self._hist_feedback = array('b', bytes(self.HISTORY_SIZE))
+        self._hist_head = 0  # Next slot to write
+        self._hist_len = 0
 
     def next_state(
         self,
         current: WordState,
-        feedback: MemoryStatus
-    ) -> WordState:
+        feedback: MemoryStatus,
+        consecutive_count: int = 0
+    ) -> Tuple[WordState, int]:
         """
         Calculate next state based on current state and feedback.
 
         Args:
             current: Current word state
             feedback: User's memory status feedback
+            consecutive_count: The word's consecutive EASY count in its
+                current state (WordRecord.consecutive_count)
 
         Returns:
-            Next word state
+            Tuple of (next_state, new_consecutive_count)
         """
         # Get transition rule
-        transitions = self.TRANSITIONS.get(current, {})
-        if feedback not in transitions:
-            logger.warning(f"No transition defined for {current} + {feedback}")
-            return current
+        state_ord = current._ord
+        key = (state_ord << 3) | feedback._ord
+        next_state = self._NEXT[key]
+        if next_state is None:
+            logger.warning("No transition defined for %s + %s", current, feedback)
+            return current, consecutive_count
 
-        next_state, required = transitions[feedback]
+        required = self._REQ[key]
 
         # Check if consecutive requirement is met
-        if required is not None:
-            if feedback == MemoryStatus.EASY:
-                self.consecutive_counts[current] = self.consecutive_counts.get(current, 0) + 1
-                if self.consecutive_counts[current] < required:
+        if feedback is MemoryStatus.EASY:
+            if required is not None:
+                consecutive_count += 1
+                if consecutive_count < required:
                     logger.debug(
-                        f"Need {required} EASY for {current} -> {next_state}, "
-                        f"have {self.consecutive_counts[current]}"
+                        "Need %d EASY for %s -> %s, have %d",
+                        required, current, next_state, consecutive_count
                     )
-                    return current
-            else:
-                # Reset consecutive count on non-EASY
-                self.consecutive_counts[current] = 0
+                    return current, consecutive_count
+        else:
+            # Reset consecutive count on non-EASY (those rules carry no
+            # requirement of their own)
+            consecutive_count = 0
 
         # Reset consecutive count when leaving state
-        if next_state != current:
-            self.consecutive_counts[current] = 0
-
-        # Record history
-        self.state_history.append((current, feedback))
-
-        # Limit history size
-        if len(self.state_history) > 100:
-            self.state_history = self.state_history[-50:]
-
-        logger.debug(f"State transition: {current.value} --[{feedback.value}]--> {next_state.value}")
-        return next_state
+        if next_state is not current:
+            consecutive_count = 0
+
+        # Record history, overwriting the oldest entry once full
+        head = self._hist_head
+        self._hist_state[head] = state_ord
+        self._hist_feedback[head] = feedback._ord
+        self._hist_head = (head + 1) % self.HISTORY_SIZE
+        if self._hist_len < self.HISTORY_SIZE:
+            self._hist_len += 1
+
+        logger.debug(
+            "State transition: %s --[%s]--> %s",
+            current.value, feedback.value, next_state.value
+        )
+        return next_state, consecutive_count
 
     def get_state_history(self, limit: int = 10) -> List[tuple[WordState, MemoryStatus]]:
         """
@@ -157,13 +210,20 @@ class WordStateMachine:
         """
         return self.state_history[-limit:]
 
+    @property
+    def state_history(self) -> List[tuple[WordState, MemoryStatus]]:
+        """Recorded (state, feedback) transitions, oldest first"""
+        size = self.HISTORY_SIZE
+        start = self._hist_head - self._hist_len
+        return [
+            (_STATES[self._hist_state[i % size]], _STATUSES[self._hist_feedback[i % size]])
+            for i in range(start, self._hist_head)
+        ]
+
     def reset(self) -> None:
         """Reset state machine to initial state"""
-        self.consecutive_counts = {
-            WordState.LEARNING: 0,
-            WordState.REVIEW: 0,
-        }
-        self.state_history = []
+        self._hist_head = 0
+        self._hist_len = 0
         logger.debug("State machine reset")
 
     def can_transition_to(
@@ -214,19 +274,24 @@ class WordStateMachine:
 
         return feedback_options
 
-    def get_state_progress(self, state: WordState) -> Dict[str, any]:
+    def get_state_progress(
+        self,
+        state: WordState,
+        consecutive_count: int = 0
+    ) -> Dict[str, any]:
         """
         Get progress information for a state.
 
         Args:
             state: State to query
+            consecutive_count: The word's consecutive EASY count in that state
 
         Returns:
             Dictionary with progress information
         """
         progress = {
             "state": state.value,
-            "consecutive_count": self.consecutive_counts.get(state, 0),
+            "consecutive_count": consecutive_count,
         }
 
         # Add requirement info if applicable
@@ -245,14 +310,21 @@ class ProgressTracker:
     Tracks overall learning progress across multiple words.
     """
 
+    __slots__ = ("_counts",)
+
+    # Progress weight per state, indexed by WordState ordinal
+    # (NEW=0, LEARNING=0.3, REVIEW=0.6, MASTERED=1.0)
+    _WEIGHTS = (0.0, 0.3, 0.6, 1.0)
+
     def __init__(self):
         """Initialize progress tracker"""
-        self.state_counts: Dict[WordState, int] = {
-            WordState.NEW: 0,
-            WordState.LEARNING: 0,
-            WordState.REVIEW: 0,
-            WordState.MASTERED: 0,
-        }
+        # Word count per state, indexed by WordState ordinal
+        self._counts: List[int] = [0] * len(WordState)
+
+    @property
+    def state_counts(self) -> Dict[WordState, int]:
+        """Word count per state"""
+        return dict(zip(WordState, self._counts))
 
     def update_state_count(self, old_state: Optional[WordState], new_state: WordState) -> None:
         """
@@ -262,13 +334,13 @@ class ProgressTracker:
             old_state: Previous state (None for new words)
             new_state: New state
         """
-        if old_state is not None and old_state in self.state_counts:
-            self.state_counts[old_state] -= 1
+        if old_state is not None:
+            self._counts[old_state._ord] -= 1
 
-        if new_state in self.state_counts:
-            self.state_counts[new_state] += 1
+        self._counts[new_state._ord] += 1
 
-        logger.debug(f"State counts updated: {self.get_summary()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("State counts updated: %s", self.get_summary())
 
     def get_summary(self) -> Dict[str, int]:
         """
@@ -279,12 +351,12 @@ class ProgressTracker:
         """
         return {
             state.value: count
-            for state, count in self.state_counts.items()
+            for state, count in zip(WordState, self._counts)
         }
 
     def get_total_words(self) -> int:
         """Get total number of tracked words"""
-        return sum(self.state_counts.values())
+        return sum(self._counts)
 
     def get_mastered_rate(self) -> float:
         """
@@ -296,8 +368,7 @@ class ProgressTracker:
         total = self.get_total_words()
         if total == 0:
             return 0.0
-        mastered = self.state_counts.get(WordState.MASTERED, 0)
-        return mastered / total
+        return self._counts[WordState.MASTERED._ord] / total
 
     def get_learning_progress(self) -> float:
         """
@@ -308,21 +379,12 @@ class ProgressTracker:
         Returns:
             Overall progress fraction [0, 1]
         """
-        weights = {
-            WordState.NEW: 0.0,
-            WordState.LEARNING: 0.3,
-            WordState.REVIEW: 0.6,
-            WordState.MASTERED: 1.0,
-        }
-
-        total = self.get_total_words()
+        counts = self._counts
+        total = sum(counts)
         if total == 0:
             return 0.0
 
-        weighted_sum = sum(
-            count * weights[state]
-            for state, count in self.state_counts.items()
-        )
+        weighted_sum = sum(c * w for c, w in zip(counts, self._WEIGHTS))
 
         return weighted_sum / total
 
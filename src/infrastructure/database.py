@@ -4,23 +4,75 @@ Database Manager for EnglishStudy application
 Handles SQLite database initialization, connections, and CRUD operations.
 """
 
+import queue
 import sqlite3
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from config import config
 from src.infrastructure.logger import get_logger, log_exception
 
 
 logger = get_logger(__name__)
 
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+class _RowCache:
+    """
+    Thread-safe LRU cache of rows keyed by primary key.
+
+    Used as a lookaside cache for rows that rarely change; callers must
+    invalidate entries whenever they write the underlying row.
+    """
+
+    __slots__ = ("_rows", "_maxsize", "_lock")
+
+    def __init__(self, maxsize: int):
+        self._rows: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: int) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached row, or None on a miss"""
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                return None
+            self._rows.move_to_end(key)
+        return dict(row)  # Callers may mutate what they get back
+
+    def put(self, key: int, row: Dict[str, Any]) -> None:
+        """Cache a copy of row, evicting the least recently used entry if full"""
+        with self._lock:
+            self._rows[key] = dict(row)
+            self._rows.move_to_end(key)
+            if len(self._rows) > self._maxsize:
+                self._rows.popitem(last=False)
+
+    def pop(self, key: int) -> None:
+        """Drop one entry"""
+        with self._lock:
+            self._rows.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._rows.clear()
+
 
 class DatabaseManager:
     """
     SQLite database manager with connection pooling and error handling.
 
+    Connections are opened lazily (up to config.DB_POOL_SIZE), configured
+    once, and reused across calls; close_all() closes them at shutdown.
+
     Usage:
         db = DatabaseManager()
         db.init_database()
@@ -62,9 +114,10 @@ class DatabaseManager:
             easiness FLOAT DEFAULT 2.5,
             interval INTEGER DEFAULT 0,
             repetitions INTEGER DEFAULT 0,
-            next_review TIMESTAMP,
+            next_review INTEGER,  -- unix epoch seconds
             last_review TIMESTAMP,
             state VARCHAR(20) DEFAULT 'new',
+            consecutive_count INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users(id),
             FOREIGN KEY (vocabulary_id) REFERENCES vocabularies(id),
@@ -108,11 +161,166 @@ class DatabaseManager:
         );
     """
 
+    # All tables, run as one script
+    SQL_CREATE_TABLES = (
+        SQL_CREATE_USERS
+        + SQL_CREATE_VOCABULARIES
+        + SQL_CREATE_WORD_RECORDS
+        + SQL_CREATE_MISTAKE_BOOK
+        + SQL_CREATE_NEW_WORD_BOOK
+        + SQL_CREATE_STUDY_SESSIONS
+    )
+
     SQL_CREATE_INDEXES = [
         "CREATE INDEX IF NOT EXISTS idx_word_records_next_review ON word_records(next_review);",
         "CREATE INDEX IF NOT EXISTS idx_word_records_user_vocab ON word_records(user_id, vocabulary_id);",
         "CREATE INDEX IF NOT EXISTS idx_mistake_book_user ON mistake_book(user_id);",
         "CREATE INDEX IF NOT EXISTS idx_new_word_book_user ON new_word_book(user_id);",
+        # Due-word range scan per user, already in next_review order
+        "CREATE INDEX IF NOT EXISTS idx_wr_user_nextreview_state ON word_records(user_id, next_review, state);",
+    ]
+
+    # Users
+    SQL_INSERT_USER = "INSERT INTO users (name, level) VALUES (?, ?)"
+
+    SQL_GET_USER = "SELECT * FROM users WHERE id = ?"
+
+    SQL_UPDATE_USER_RATING = "UPDATE users SET rating = ? WHERE id = ?"
+
+    # Vocabularies
+    SQL_INSERT_VOCABULARY = """
+        INSERT OR REPLACE INTO vocabularies
+        (word, phonetic, definition, example, difficulty, frequency, category)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    SQL_GET_VOCABULARY_ID_BY_WORD = "SELECT id FROM vocabularies WHERE word = ?"
+
+    SQL_GET_VOCABULARY_BY_WORD = "SELECT * FROM vocabularies WHERE word = ?"
+
+    SQL_GET_VOCABULARY_BY_ID = "SELECT * FROM vocabularies WHERE id = ?"
+
+    SQL_GET_VOCABULARIES_BY_DIFFICULTY = "SELECT * FROM vocabularies WHERE difficulty = ? LIMIT ?"
+
+    # Word records
+    SQL_GET_WORD_RECORD = """
+        SELECT * FROM word_records
+        WHERE user_id = ? AND vocabulary_id = ?
+    """
+
+    SQL_INSERT_WORD_RECORD = """
+        INSERT INTO word_records (user_id, vocabulary_id, created_at)
+        VALUES (?, ?, ?)
+    """
+
+    SQL_INSERT_WORD_RECORD_RETURNING = """
+        INSERT INTO word_records (user_id, vocabulary_id)
+        VALUES (?, ?)
+        RETURNING *
+    """
+
+    SQL_UPDATE_WORD_RECORD = """
+        UPDATE word_records
+        SET status = ?, easiness = ?, interval = ?,
+            repetitions = ?, next_review = ?, state = ?,
+            consecutive_count = COALESCE(?, consecutive_count),
+            last_review = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+
+    SQL_GET_DUE_WORDS = """
+        SELECT wr.*, v.word, v.phonetic, v.definition, v.example, v.difficulty, v.id as vocab_id
+        FROM word_records wr
+        JOIN vocabularies v ON wr.vocabulary_id = v.id
+        WHERE wr.user_id = ?
+          AND wr.next_review IS NOT NULL
+          AND wr.next_review <= CAST(strftime('%s', 'now') AS INTEGER)
+          AND wr.state != 'mastered'
+        ORDER BY wr.next_review ASC
+        LIMIT ?
+    """
+
+    SQL_GET_NEW_WORDS = """
+        SELECT v.*
+        FROM vocabularies v
+        WHERE NOT EXISTS (
+            SELECT 1 FROM word_records wr
+            WHERE wr.user_id = ? AND wr.vocabulary_id = v.id
+        )
+        LIMIT ?
+    """
+
+    # Mistake book
+    SQL_ADD_TO_MISTAKE_BOOK = """
+        INSERT OR IGNORE INTO mistake_book
+        (user_id, word_record_id, note)
+        VALUES (?, ?, ?)
+    """
+
+    SQL_GET_MISTAKE_BOOK = """
+        SELECT mb.*, wr.user_id, v.word, v.definition
+        FROM mistake_book mb
+        JOIN word_records wr ON mb.word_record_id = wr.id
+        JOIN vocabularies v ON wr.vocabulary_id = v.id
+        WHERE mb.user_id = ?
+        ORDER BY mb.created_at DESC
+    """
+
+    # New word book
+    SQL_ADD_TO_NEW_WORD_BOOK = """
+        INSERT OR IGNORE INTO new_word_book
+        (user_id, word_record_id, note)
+        VALUES (?, ?, ?)
+    """
+
+    SQL_GET_NEW_WORD_BOOK = """
+        SELECT nwb.*, wr.user_id, v.word, v.definition
+        FROM new_word_book nwb
+        JOIN word_records wr ON nwb.word_record_id = wr.id
+        JOIN vocabularies v ON wr.vocabulary_id = v.id
+        WHERE nwb.user_id = ?
+        ORDER BY nwb.created_at DESC
+    """
+
+    # Study sessions
+    SQL_INSERT_STUDY_SESSION = """
+        INSERT INTO study_sessions (user_id, start_time)
+        VALUES (?, datetime('now'))
+    """
+
+    SQL_END_STUDY_SESSION = """
+        UPDATE study_sessions
+        SET end_time = datetime('now'),
+            words_studied = ?,
+            correct_rate = ?
+        WHERE id = ?
+    """
+
+    # Statistics
+    SQL_GET_USER_STATS = """
+        SELECT
+            COALESCE(SUM(status != 'unknown'), 0) AS total_studied,
+            COALESCE(SUM(state = 'mastered'), 0) AS mastered,
+            COALESCE(SUM(next_review IS NOT NULL
+                         AND next_review <= CAST(strftime('%s', 'now') AS INTEGER)), 0) AS due
+        FROM word_records
+        WHERE user_id = ?
+    """
+
+    # Stored in PRAGMA user_version once the schema is up to date; bump it
+    # whenever the SQL_CREATE_* statements or migrations change
+    SCHEMA_VERSION = 2
+
+    # Per-connection tuning applied right after connecting
+    SQL_CONNECTION_PRAGMAS = [
+        "PRAGMA synchronous = NORMAL",     # Safe with WAL, far fewer fsyncs
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -20000",      # ~20 MB page cache
+        "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped I/O
+        "PRAGMA journal_size_limit = 16777216",  # Truncate the WAL to 16 MB after checkpoints
+        "PRAGMA foreign_keys = ON",
+        # Lock waits happen inside SQLite's busy handler, in milliseconds
+        f"PRAGMA busy_timeout = {int(config.DB_TIMEOUT * 1000)}",
     ]
 
     def __init__(self, db_path: Optional[Path] = None):
@@ -125,36 +333,133 @@ class DatabaseManager:
         self.db_path = db_path or config.db_path
         self._ensure_user_data_dir()
 
+        # Connection pool: idle connections wait in the queue. Every
+        # connection to ":memory:" opens its own empty database, so an
+        # in-memory database gets a single connection.
+        self._pool_size = 1 if str(self.db_path) == ":memory:" else config.DB_POOL_SIZE
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self._pool_size)
+        self._pool_lock = threading.Lock()
+        self._created_connections = 0
+
+        # Lookaside caches for user and vocabulary rows fetched by ID
+        self._user_cache = _RowCache(config.DB_ROW_CACHE_SIZE)
+        self._vocab_cache = _RowCache(config.DB_ROW_CACHE_SIZE)
+
     def _ensure_user_data_dir(self) -> None:
         """Ensure user data directory exists"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Database path: {self.db_path}")
+        logger.debug("Database path: %s", self.db_path)
 
     @contextmanager
     def get_connection(self):
         """
-        Get a database connection with automatic cleanup.
+        Check out a pooled database connection and return it afterwards.
+
+        Connections are configured when created, so checkout and return run
+        no SQL; any transaction left open by the caller is rolled back before
+        the connection goes back to the pool.
 
         Yields:
             sqlite3.Connection: Database connection
         """
         conn = None
         try:
-            conn = sqlite3.connect(
-                str(self.db_path),
-                timeout=config.DB_TIMEOUT
-            )
-            conn.row_factory = sqlite3.Row  # Enable column access by name
-            conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign keys
-            logger.debug("Database connection established")
+            conn = self._acquire_connection()
             yield conn
         except sqlite3.Error as e:
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise
         finally:
-            if conn:
+            if conn is not None:
+                self._release_connection(conn)
+
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """Take an idle pooled connection, opening a new one if below pool size"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            can_create = self._created_connections < self._pool_size
+            if can_create:
+                self._created_connections += 1
+
+        if can_create:
+            try:
+                return self._create_connection()
+            except BaseException:
+                with self._pool_lock:
+                    self._created_connections -= 1
+                raise
+
+        try:
+            return self._pool.get(timeout=config.DB_TIMEOUT)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a pooled database connection")
+
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, discarding uncommitted changes"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            # Not safe to reuse (e.g. closed by the caller): drop it so a new
+            # one can be opened. Not re-raised, since this runs while the
+            # caller's own exception may be propagating.
+            logger.warning("Discarding pooled connection after failed rollback: %s", e)
+            try:
                 conn.close()
-                logger.debug("Database connection closed")
+            except sqlite3.Error:
+                pass
+            with self._pool_lock:
+                self._created_connections -= 1
+            return
+        self._pool.put(conn)
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open and configure a new pooled connection"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=config.DB_TIMEOUT,
+            check_same_thread=False,  # Pooled connections move between threads
+            cached_statements=256  # Keep every SQL_* statement prepared
+        )
+        self._configure_connection(conn)
+        logger.debug("Database connection established")
+        return conn
+
+    def close_all(self) -> None:
+        """Close all idle pooled connections (call at application shutdown)"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                # Refresh planner statistics that went stale during the session
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning("PRAGMA optimize failed: %s", e)
+            conn.close()
+            with self._pool_lock:
+                self._created_connections -= 1
+        logger.debug("Database connections closed")
+
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply all per-connection settings to a new connection.
+
+        Runs exactly once per pooled connection, so checking a connection
+        out of the pool issues no SQL. WAL lets readers proceed while a
+        write is in progress and avoids an fsync per commit; it is skipped
+        for in-memory databases.
+        """
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        if str(self.db_path) != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+        for pragma in self.SQL_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
 
     @log_exception(logger)
     def init_database(self) -> bool:
@@ -166,26 +471,55 @@ class DatabaseManager:
         """
         try:
             with self.get_connection() as conn:
-                # Create tables
-                conn.execute(self.SQL_CREATE_USERS)
-                conn.execute(self.SQL_CREATE_VOCABULARIES)
-                conn.execute(self.SQL_CREATE_WORD_RECORDS)
-                conn.execute(self.SQL_CREATE_MISTAKE_BOOK)
-                conn.execute(self.SQL_CREATE_NEW_WORD_BOOK)
-                conn.execute(self.SQL_CREATE_STUDY_SESSIONS)
-
-                # Create indexes
-                for index_sql in self.SQL_CREATE_INDEXES:
-                    conn.execute(index_sql)
+                # Schema already current: nothing to create or migrate
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version == self.SCHEMA_VERSION:
+                    logger.debug("Database schema is up to date (version %d)", version)
+                    return True
+
+                # Create tables (executescript runs the batch in one call)
+                conn.executescript(self.SQL_CREATE_TABLES)
+
+                # Add columns introduced after the initial schema
+                self._migrate_word_records(conn)
+
+                # Create indexes, then record the schema version; executescript
+                # commits, so the version is only stored once all of it ran.
+                # PRAGMA arguments cannot be bound as parameters.
+                conn.executescript(
+                    "\n".join(self.SQL_CREATE_INDEXES)
+                    + f"\nPRAGMA user_version = {int(self.SCHEMA_VERSION)};"
+                )
 
-                conn.commit()
+                # Gather planner statistics for all tables up front
+                conn.execute("PRAGMA optimize(0x10002)")
                 logger.info("Database schema initialized successfully")
                 return True
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             return False
 
+    def _migrate_word_records(self, conn: sqlite3.Connection) -> None:
+        """Bring word_records tables created by older versions up to date"""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(word_records)")}
+        if "consecutive_count" not in columns:
+            conn.execute(
+                "ALTER TABLE word_records ADD COLUMN consecutive_count INTEGER DEFAULT 0"
+            )
+            logger.info("Migrated word_records: added consecutive_count column")
+
+        # next_review used to be stored as local-time ISO text; convert
+        # it to epoch seconds ('utc' treats the stored value as local time)
+        cursor = conn.execute(
+            "UPDATE word_records"
+            " SET next_review = CAST(strftime('%s', next_review, 'utc') AS INTEGER)"
+            " WHERE typeof(next_review) = 'text'"
+        )
+        if cursor.rowcount:
+            logger.info("Migrated word_records: %d next_review values to epoch seconds", cursor.rowcount)
+        conn.commit()
+
     # ========== User Operations ==========
 
     @log_exception(logger)
@@ -202,35 +536,44 @@ class DatabaseManager:
         """
         with self.get_connection() as conn:
             cursor = conn.execute(
-                "INSERT INTO users (name, level) VALUES (?, ?)",
+                self.SQL_INSERT_USER,
                 (name, level)
             )
             conn.commit()
             user_id = cursor.lastrowid
-            logger.info(f"Created user: {name} (ID: {user_id}, Level: {level})")
+            logger.info("Created user: %s (ID: %s, Level: %s)", name, user_id, level)
             return user_id
 
     @log_exception(logger)
     def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return user
+
         with self.get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM users WHERE id = ?",
+                self.SQL_GET_USER,
                 (user_id,)
             )
             row = cursor.fetchone()
-            return dict(row) if row else None
+            if row is None:
+                return None
+            user = dict(row)
+            self._user_cache.put(user_id, user)
+            return user
 
     @log_exception(logger)
     def update_user_rating(self, user_id: int, rating: float) -> bool:
         """Update user ELO rating"""
         with self.get_connection() as conn:
             conn.execute(
-                "UPDATE users SET rating = ? WHERE id = ?",
+                self.SQL_UPDATE_USER_RATING,
                 (rating, user_id)
             )
             conn.commit()
-            logger.debug(f"Updated user {user_id} rating to {rating}")
+            self._user_cache.pop(user_id)
+            logger.debug("Updated user %s rating to %s", user_id, rating)
             return True
 
     # ========== Vocabulary Operations ==========
@@ -250,41 +593,63 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.execute(
-                    """
-                    INSERT OR REPLACE INTO vocabularies
-                    (word, phonetic, definition, example, difficulty, frequency, category)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        vocab_data.get("word"),
-                        vocab_data.get("phonetic"),
-                        vocab_data.get("definition", ""),
-                        vocab_data.get("example"),
-                        vocab_data.get("difficulty", 1),
-                        vocab_data.get("frequency", 1),
-                        vocab_data.get("category")
-                    )
+                    self.SQL_INSERT_VOCABULARY,
+                    self._vocabulary_row(vocab_data)
                 )
                 conn.commit()
+                # INSERT OR REPLACE may have deleted an existing row under another ID
+                self._vocab_cache.clear()
                 vocab_id = cursor.lastrowid
-                logger.debug(f"Inserted vocabulary: {vocab_data.get('word')} (ID: {vocab_id})")
+                logger.debug("Inserted vocabulary: %s (ID: %s)", vocab_data.get("word"), vocab_id)
                 return vocab_id
         except sqlite3.IntegrityError:
             # Word already exists, get its ID
             with self.get_connection() as conn:
                 cursor = conn.execute(
-                    "SELECT id FROM vocabularies WHERE word = ?",
+                    self.SQL_GET_VOCABULARY_ID_BY_WORD,
                     (vocab_data.get("word"),)
                 )
                 row = cursor.fetchone()
                 return row["id"] if row else None
 
+    @log_exception(logger)
+    def insert_vocabularies_bulk(self, vocabs: List[Dict[str, Any]]) -> int:
+        """
+        Insert many vocabulary entries in a single transaction.
+
+        Args:
+            vocabs: Dictionaries with the same keys as insert_vocabulary
+
+        Returns:
+            Number of entries written
+        """
+        rows = [self._vocabulary_row(vocab_data) for vocab_data in vocabs]
+        with self.get_connection() as conn:
+            conn.executemany(self.SQL_INSERT_VOCABULARY, rows)
+            conn.commit()
+        self._vocab_cache.clear()
+        logger.debug("Inserted %d vocabularies", len(rows))
+        return len(rows)
+
+    @staticmethod
+    def _vocabulary_row(vocab_data: Dict[str, Any]) -> Tuple:
+        """Build the SQL_INSERT_VOCABULARY parameters for one entry"""
+        return (
+            vocab_data.get("word"),
+            vocab_data.get("phonetic"),
+            vocab_data.get("definition", ""),
+            vocab_data.get("example"),
+            vocab_data.get("difficulty", 1),
+            vocab_data.get("frequency", 1),
+            vocab_data.get("category")
+        )
+
     @log_exception(logger)
     def get_vocabulary_by_word(self, word: str) -> Optional[Dict[str, Any]]:
         """Get vocabulary entry by word"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM vocabularies WHERE word = ?",
+                self.SQL_GET_VOCABULARY_BY_WORD,
                 (word,)
             )
             row = cursor.fetchone()
@@ -293,13 +658,21 @@ class DatabaseManager:
     @log_exception(logger)
     def get_vocabulary_by_id(self, vocab_id: int) -> Optional[Dict[str, Any]]:
         """Get vocabulary entry by ID"""
+        vocab = self._vocab_cache.get(vocab_id)
+        if vocab is not None:
+            return vocab
+
         with self.get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM vocabularies WHERE id = ?",
+                self.SQL_GET_VOCABULARY_BY_ID,
                 (vocab_id,)
             )
             row = cursor.fetchone()
-            return dict(row) if row else None
+            if row is None:
+                return None
+            vocab = dict(row)
+            self._vocab_cache.put(vocab_id, vocab)
+            return vocab
 
     @log_exception(logger)
     def get_vocabularies_by_difficulty(
@@ -310,10 +683,10 @@ class DatabaseManager:
         """Get vocabularies by difficulty level"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM vocabularies WHERE difficulty = ? LIMIT ?",
+                self.SQL_GET_VOCABULARIES_BY_DIFFICULTY,
                 (difficulty, limit)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
 
     # ========== Word Record Operations ==========
 
@@ -336,10 +709,7 @@ class DatabaseManager:
         with self.get_connection() as conn:
             # Try to get existing record
             cursor = conn.execute(
-                """
-                SELECT * FROM word_records
-                WHERE user_id = ? AND vocabulary_id = ?
-                """,
+                self.SQL_GET_WORD_RECORD,
                 (user_id, vocabulary_id)
             )
             row = cursor.fetchone()
@@ -347,21 +717,39 @@ class DatabaseManager:
             if row:
                 return dict(row)
 
-            # Create new record
+            if _HAS_RETURNING:
+                # Insert and read back the full row in one statement
+                row = conn.execute(
+                    self.SQL_INSERT_WORD_RECORD_RETURNING,
+                    (user_id, vocabulary_id)
+                ).fetchone()
+                conn.commit()
+                return dict(row)
+
+            # Create new record; created_at is supplied in CURRENT_TIMESTAMP
+            # format so the row can be built here without reading it back
+            created_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
             cursor = conn.execute(
-                """
-                INSERT INTO word_records (user_id, vocabulary_id)
-                VALUES (?, ?)
-                """,
-                (user_id, vocabulary_id)
+                self.SQL_INSERT_WORD_RECORD,
+                (user_id, vocabulary_id, created_at)
             )
             conn.commit()
 
-            cursor = conn.execute(
-                "SELECT * FROM word_records WHERE id = ?",
-                (cursor.lastrowid,)
-            )
-            return dict(cursor.fetchone())
+            # Remaining columns hold their schema defaults
+            return {
+                "id": cursor.lastrowid,
+                "user_id": user_id,
+                "vocabulary_id": vocabulary_id,
+                "status": "unknown",
+                "easiness": 2.5,
+                "interval": 0,
+                "repetitions": 0,
+                "next_review": None,
+                "last_review": None,
+                "state": "new",
+                "consecutive_count": 0,
+                "created_at": created_at,
+            }
 
     @log_exception(logger)
     def update_word_record(
@@ -371,8 +759,9 @@ class DatabaseManager:
         easiness: float,
         interval: int,
         repetitions: int,
-        next_review: Optional[str] = None,
-        state: str = "learning"
+        next_review: Optional[int] = None,
+        state: str = "learning",
+        consecutive_count: Optional[int] = None
     ) -> bool:
         """
         Update word record after study.
@@ -383,53 +772,65 @@ class DatabaseManager:
             easiness: SM-2 easiness factor
             interval: Review interval in days
             repetitions: Number of repetitions
-            next_review: Next review date (ISO format string)
+            next_review: Next review time (unix epoch seconds)
             state: Learning state (new/learning/review/mastered)
+            consecutive_count: Consecutive EASY count in the new state
+                (None leaves the stored count unchanged)
 
         Returns:
             True if successful
         """
         with self.get_connection() as conn:
             conn.execute(
-                """
-                UPDATE word_records
-                SET status = ?, easiness = ?, interval = ?,
-                    repetitions = ?, next_review = ?, state = ?,
-                    last_review = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (status, easiness, interval, repetitions, next_review, state, record_id)
+                self.SQL_UPDATE_WORD_RECORD,
+                (status, easiness, interval, repetitions, next_review, state,
+                 consecutive_count, record_id)
             )
             conn.commit()
-            logger.debug(f"Updated word record {record_id}: status={status}, interval={interval}")
+            logger.debug("Updated word record %s: status=%s, interval=%s", record_id, status, interval)
             return True
 
     @log_exception(logger)
-    def get_due_words(self, user_id: int) -> List[Dict[str, Any]]:
+    def get_due_words(
+        self,
+        user_id: int,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get words due for review.
 
         Args:
             user_id: User ID
+            limit: Maximum number of words to return (default: all)
 
         Returns:
-            List of word records with vocabulary data
+            List of word records with vocabulary data, most overdue first
+        """
+        return list(self.iter_due_words(user_id, limit))
+
+    def iter_due_words(
+        self,
+        user_id: int,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield words due for review one at a time, most overdue first.
+
+        Rows are read from the cursor as they are consumed, so callers that
+        stop early never materialize the rest of the result set. The pooled
+        connection is held until the generator is exhausted or closed.
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of words to yield (default: all)
         """
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT wr.*, v.word, v.phonetic, v.definition, v.example, v.difficulty, v.id as vocab_id
-                FROM word_records wr
-                JOIN vocabularies v ON wr.vocabulary_id = v.id
-                WHERE wr.user_id = ?
-                  AND wr.next_review IS NOT NULL
-                  AND wr.next_review <= datetime('now')
-                  AND wr.state != 'mastered'
-                ORDER BY wr.next_review ASC
-                """,
-                (user_id,)
+                self.SQL_GET_DUE_WORDS,
+                (user_id, -1 if limit is None else limit)  # LIMIT -1 means no limit
             )
-            return [dict(row) for row in cursor.fetchall()]
+            for row in cursor:
+                yield dict(row)
 
     @log_exception(logger)
     def get_new_words(
@@ -449,17 +850,10 @@ class DatabaseManager:
         """
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT v.*
-                FROM vocabularies v
-                LEFT JOIN word_records wr
-                    ON v.id = wr.vocabulary_id AND wr.user_id = ?
-                WHERE wr.id IS NULL
-                LIMIT ?
-                """,
+                self.SQL_GET_NEW_WORDS,
                 (user_id, limit)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
 
     # ========== Mistake Book Operations ==========
 
@@ -471,21 +865,17 @@ class DatabaseManager:
         note: str = ""
     ) -> bool:
         """Add a word to the mistake book"""
-        try:
-            with self.get_connection() as conn:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO mistake_book
-                    (user_id, word_record_id, note)
-                    VALUES (?, ?, ?)
-                    """,
-                    (user_id, word_record_id, note)
-                )
-                conn.commit()
-                logger.debug(f"Added word record {word_record_id} to mistake book")
-                return True
-        except sqlite3.IntegrityError:
-            logger.debug(f"Word record {word_record_id} already in mistake book")
+        with self.get_connection() as conn:
+            # OR IGNORE skips rows already in the book; rowcount tells which
+            cursor = conn.execute(
+                self.SQL_ADD_TO_MISTAKE_BOOK,
+                (user_id, word_record_id, note)
+            )
+            conn.commit()
+            if cursor.rowcount:
+                logger.debug("Added word record %s to mistake book", word_record_id)
+            else:
+                logger.debug("Word record %s already in mistake book", word_record_id)
             return True
 
     @log_exception(logger)
@@ -493,17 +883,10 @@ class DatabaseManager:
         """Get all entries in the mistake book"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT mb.*, wr.user_id, v.word, v.definition
-                FROM mistake_book mb
-                JOIN word_records wr ON mb.word_record_id = wr.id
-                JOIN vocabularies v ON wr.vocabulary_id = v.id
-                WHERE mb.user_id = ?
-                ORDER BY mb.created_at DESC
-                """,
+                self.SQL_GET_MISTAKE_BOOK,
                 (user_id,)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
 
     # ========== New Word Book Operations ==========
 
@@ -515,21 +898,17 @@ class DatabaseManager:
         note: str = ""
     ) -> bool:
         """Add a word to the new word book"""
-        try:
-            with self.get_connection() as conn:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO new_word_book
-                    (user_id, word_record_id, note)
-                    VALUES (?, ?, ?)
-                    """,
-                    (user_id, word_record_id, note)
-                )
-                conn.commit()
-                logger.debug(f"Added word record {word_record_id} to new word book")
-                return True
-        except sqlite3.IntegrityError:
-            logger.debug(f"Word record {word_record_id} already in new word book")
+        with self.get_connection() as conn:
+            # OR IGNORE skips rows already in the book; rowcount tells which
+            cursor = conn.execute(
+                self.SQL_ADD_TO_NEW_WORD_BOOK,
+                (user_id, word_record_id, note)
+            )
+            conn.commit()
+            if cursor.rowcount:
+                logger.debug("Added word record %s to new word book", word_record_id)
+            else:
+                logger.debug("Word record %s already in new word book", word_record_id)
             return True
 
     @log_exception(logger)
@@ -537,17 +916,10 @@ class DatabaseManager:
         """Get all entries in the new word book"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT nwb.*, wr.user_id, v.word, v.definition
-                FROM new_word_book nwb
-                JOIN word_records wr ON nwb.word_record_id = wr.id
-                JOIN vocabularies v ON wr.vocabulary_id = v.id
-                WHERE nwb.user_id = ?
-                ORDER BY nwb.created_at DESC
-                """,
+                self.SQL_GET_NEW_WORD_BOOK,
                 (user_id,)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
 
     # ========== Study Session Operations ==========
 
@@ -556,15 +928,12 @@ class DatabaseManager:
         """Create a new study session"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO study_sessions (user_id, start_time)
-                VALUES (?, datetime('now'))
-                """,
+                self.SQL_INSERT_STUDY_SESSION,
                 (user_id,)
             )
             conn.commit()
             session_id = cursor.lastrowid
-            logger.info(f"Created study session {session_id} for user {user_id}")
+            logger.info("Created study session %s for user %s", session_id, user_id)
             return session_id
 
     @log_exception(logger)
@@ -577,64 +946,47 @@ class DatabaseManager:
         """End a study session with statistics"""
         with self.get_connection() as conn:
             conn.execute(
-                """
-                UPDATE study_sessions
-                SET end_time = datetime('now'),
-                    words_studied = ?,
-                    correct_rate = ?
-                WHERE id = ?
-                """,
+                self.SQL_END_STUDY_SESSION,
                 (words_studied, correct_rate, session_id)
             )
             conn.commit()
-            logger.info(f"Ended session {session_id}: {words_studied} words, {correct_rate:.2%} correct")
+            logger.info(
+                "Ended session %s: %d words, %.2f%% correct",
+                session_id, words_studied, correct_rate * 100
+            )
             return True
 
     @log_exception(logger)
     def get_user_stats(self, user_id: int) -> Dict[str, Any]:
         """Get overall user statistics"""
         with self.get_connection() as conn:
-            # Total words studied
-            cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM word_records WHERE user_id = ? AND status != 'unknown'",
-                (user_id,)
-            )
-            total_studied = cursor.fetchone()["count"]
-
-            # Mastered words
-            cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM word_records WHERE user_id = ? AND state = 'mastered'",
-                (user_id,)
-            )
-            mastered = cursor.fetchone()["count"]
-
-            # Due for review
+            # All three counts from a single pass over the user's records
             cursor = conn.execute(
-                """
-                SELECT COUNT(*) as count FROM word_records
-                WHERE user_id = ?
-                  AND next_review IS NOT NULL
-                  AND next_review <= datetime('now')
-                """,
+                self.SQL_GET_USER_STATS,
                 (user_id,)
             )
-            due = cursor.fetchone()["count"]
+            row = cursor.fetchone()
 
             return {
-                "total_studied": total_studied,
-                "mastered": mastered,
-                "due_for_review": due,
+                "total_studied": row["total_studied"],
+                "mastered": row["mastered"],
+                "due_for_review": row["due"],
             }
 
 
 # Global database instance
 _db_instance: Optional[DatabaseManager] = None
+_db_lock = threading.Lock()
 
 
 def get_db() -> DatabaseManager:
-    """Get the global database instance"""
+    """Get the global database instance (thread-safe, initialized once)"""
     global _db_instance
     if _db_instance is None:
-        _db_instance = DatabaseManager()
-        _db_instance.init_database()
+        with _db_lock:
+            if _db_instance is None:
+                db = DatabaseManager()
+                db.init_database()
+                # Publish only once the schema is ready
+                _db_instance = db
     return _db_instance
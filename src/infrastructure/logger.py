@@ -5,6 +5,7 @@ Provides structured logging with file and console handlers.
 """
 
 import logging
+import reprlib
 import sys
 from pathlib import Path
 from typing import Optional
@@ -78,7 +79,7 @@ class Logger:
 
         # Log initialization
         root_logger.info("=" * 50)
-        root_logger.info(f"{config.APP_NAME} v{config.VERSION} - Logger initialized")
+        root_logger.info("%s v%s - Logger initialized", config.APP_NAME, config.VERSION)
         root_logger.info("=" * 50)
 
     @classmethod
@@ -114,6 +115,12 @@ def get_logger(name: str) -> logging.Logger:
     return Logger.get_logger(name)
 
 
+# Length-bounded repr for logging call arguments and results
+_REPR = reprlib.Repr()
+_REPR.maxstring = 80
+_REPR.maxother = 80
+
+
 def log_function_call(func):
     """
     Decorator to log function calls with arguments and return values.
@@ -124,17 +131,25 @@ def log_function_call(func):
             return arg1 + arg2
     """
     logger = get_logger("function_calls")
+    func_name = func.__name__
 
     def wrapper(*args, **kwargs):
-        func_name = func.__name__
-        logger.debug(f"Calling {func_name} with args={args}, kwargs={kwargs}")
+        # Skip formatting the arguments entirely unless DEBUG is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            # reprlib bounds the cost of large payloads (row lists, dicts)
+            logger.debug(
+                "Calling %s with args=%s, kwargs=%s",
+                func_name, _REPR.repr(args), _REPR.repr(kwargs)
+            )
 
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func_name} returned {result}")
+            if debug:
+                logger.debug("%s returned %s", func_name, _REPR.repr(result))
             return result
         except Exception as e:
-            logger.error(f"{func_name} raised {type(e).__name__}: {e}")
+            logger.error("%s raised %s: %s", func_name, type(e).__name__, e)
             raise
 
     return wrapper
@@ -150,15 +165,16 @@ def log_exception(logger: Optional[logging.Logger] = None):
             raise ValueError("Something went wrong")
     """
     def decorator(func):
+        # Resolved once per decorated function, not per call
         nonlocal_logger = logger or get_logger(func.__module__)
+        func_name = func.__name__
 
         def wrapper(*args, **kwargs):
-            func_name = func.__name__
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 nonlocal_logger.error(
-                    f"Exception in {func_name}: {type(e).__name__}: {e}",
+                    "Exception in %s: %s: %s", func_name, type(e).__name__, e,
                     exc_info=True
                 )
                 raise
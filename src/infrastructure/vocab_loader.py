@@ -4,21 +4,120 @@ Vocabulary Loader for EnglishStudy application
 Handles loading vocabulary data from JSON files and user imports.
 """
 
+import csv
+import hashlib
 import json
 import logging
+import mmap
+import os
+import pickle
+import re
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
 from config import config
 from src.infrastructure.logger import get_logger, log_exception
 
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+# Characters read from the start of a JSON file when looking for "meta";
+# the peek doubles up to META_PEEK_MAX_CHARS for long meta objects before
+# falling back to parsing the whole file
+META_PEEK_CHARS = 4096
+META_PEEK_MAX_CHARS = 262144
+
+# JSON files at least this large are memory-mapped for parsing
+MMAP_MIN_BYTES = 4 * 1024 * 1024
+
+# Threads used to read metadata when listing vocabulary files
+META_READ_WORKERS = 8
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Opening of a JSON document whose first key is "meta"
+_META_PREFIX = re.compile(r'\s*\{\s*"meta"\s*:\s*')
+
+
+def _read_json_meta(path: Path) -> Dict[str, Any]:
+    """
+    Read the "meta" object of a vocabulary JSON file.
+
+    Vocabulary files put "meta" first, so it is decoded from the head of
+    the file without parsing the word list; otherwise the whole file is
+    parsed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(META_PEEK_CHARS)
+        match = _META_PREFIX.match(head)
+        while match is not None:
+            try:
+                meta, _ = _JSON_DECODER.raw_decode(head, match.end())
+            except ValueError:
+                # meta runs past the peeked head: read as much again
+                if len(head) >= META_PEEK_MAX_CHARS:
+                    break
+                more = f.read(len(head))
+                if not more:
+                    break
+                head += more
+                continue
+            if isinstance(meta, dict):
+                return meta
+            break
+
+    if path.suffix.lower() == ".jsonl":
+        return {}  # Only a leading line can carry meta
+
+    data = _read_json(path)
+    if isinstance(data, dict) and isinstance(data.get("meta"), dict):
+        return data["meta"]
+    return {}
+
+
+def _try_read_json_meta(path: Path) -> Dict[str, Any]:
+    """_read_json_meta, with unreadable files reported as having no metadata"""
+    try:
+        return _read_json_meta(path)
+    except Exception:
+        return {}
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file straight from its bytes (orjson when installed)"""
+    if orjson is not None and path.stat().st_size >= MMAP_MIN_BYTES:
+        # orjson parses from a buffer, so large files are parsed from the
+        # page cache without first copying them into a bytes object
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class VocabFormat(Enum):
     """Supported vocabulary file formats"""
     JSON = "json"
+    JSONL = "jsonl"
     CSV = "csv"
     TXT = "txt"
 
@@ -29,6 +128,7 @@ class VocabLoader:
 
     Supported formats:
     - JSON: Structured format with full word information
+    - JSONL: JSON Lines, one word object per line (streamable)
     - CSV: Simple word-definition format
     - TXT: Plain text word list
     """
@@ -41,16 +141,25 @@ class VocabLoader:
     DEFAULT_DIFFICULTY = 1
     DEFAULT_FREQUENCY = 1
 
-    def __init__(self, vocab_dir: Optional[Path] = None):
+    # Bump when parsing or validation changes so stale caches are ignored
+    CACHE_VERSION = 1
+
+    def __init__(self, vocab_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize vocabulary loader.
 
         Args:
             vocab_dir: Path to vocabulary directory (default: from config)
+            cache_dir: Directory for parsed-vocabulary caches
+                (default: vocab_cache under the user data directory)
         """
         self.vocab_dir = vocab_dir or config.vocab_path
+        self.cache_dir = cache_dir or config.user_data_path / "vocab_cache"
         self._ensure_vocab_dir()
 
+        # Validated word lists by path, with the file state they came from
+        self._memo: Dict[Path, Tuple[tuple, List[Dict[str, Any]]]] = {}
+
     def _ensure_vocab_dir(self) -> None:
         """Ensure vocabulary directory exists"""
         self.vocab_dir.mkdir(parents=True, exist_ok=True)
@@ -71,6 +180,42 @@ class VocabLoader:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is not supported
         """
+        # Callers may mutate entries, so each gets its own copy
+        return [dict(w) for w in self._load_words(file_path)]
+
+    @log_exception(logger)
+    def load_vocabulary_columnar(self, file_path: str) -> Dict[str, Any]:
+        """
+        Load vocabulary from file as parallel columns.
+
+        Same words as load_vocabulary, without a dict per word: column
+        "word" holds every word, "difficulty" every difficulty and so on,
+        all in file order. Suited to whole-list filtering and statistics.
+
+        Args:
+            file_path: Path to vocabulary file (relative or absolute)
+
+        Returns:
+            Dictionary mapping each word field to its column; "difficulty"
+            and "frequency" are compact unsigned byte arrays, the text
+            fields lists of str (None where missing)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is not supported
+        """
+        words = self._load_words(file_path)
+        columns: Dict[str, Any] = {
+            field: [w[field] for w in words]
+            for field in ("word", "definition", "phonetic", "example", "category")
+        }
+        # Validation clamps both to 1-100, so they fit in a byte
+        columns["difficulty"] = array("B", [w["difficulty"] for w in words])
+        columns["frequency"] = array("B", [w["frequency"] for w in words])
+        return columns
+
+    def _load_words(self, file_path: str) -> List[Dict[str, Any]]:
+        """Validated words for a file; the list is shared, so never mutate it"""
         path = Path(file_path)
         if not path.is_absolute():
             path = self.vocab_dir / path
@@ -81,6 +226,7 @@ class VocabLoader:
         # Detect format from extension
         format_map = {
             ".json": VocabFormat.JSON,
+            ".jsonl": VocabFormat.JSONL,
             ".csv": VocabFormat.CSV,
             ".txt": VocabFormat.TXT,
         }
@@ -91,13 +237,89 @@ class VocabLoader:
 
         file_format = format_map[suffix]
 
+        # Reuse an earlier parse while the file is unchanged
+        stat = path.stat()
+        key = (self.CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        words = self._get_cached(path, key)
+        if words is not None:
+            return words
+
         # Load based on format
         if file_format == VocabFormat.JSON:
-            return self._load_json(path)
+            words = self._load_json(path)
+        elif file_format == VocabFormat.JSONL:
+            words = self._load_jsonl(path)
         elif file_format == VocabFormat.CSV:
-            return self._load_csv(path)
+            words = self._load_csv(path)
         else:  # TXT
-            return self._load_txt(path)
+            words = self._load_txt(path)
+
+        self._memo[path] = (key, words)
+        if self._uses_disk_cache(path):
+            self._write_cache(path, key, words)
+        return words
+
+    def _uses_disk_cache(self, path: Path) -> bool:
+        """
+        Whether path gets a pickle cache file.
+
+        Only the bundled vocabularies under vocab_dir are loaded again and
+        again; a one-off import from elsewhere would just leave a cache
+        file behind that nothing ever reads or removes.
+        """
+        return path.resolve().is_relative_to(self.vocab_dir.resolve())
+
+    def _cache_path(self, path: Path) -> Path:
+        """Cache file for a vocabulary file (named by a hash of its path)"""
+        digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{path.stem}.{digest}.pkl"
+
+    def _get_cached(self, path: Path, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Validated words for path if cached under the same key.
+
+        Checks the in-process memo first, then (for files under vocab_dir)
+        the pickle cache file, whose key is stored ahead of the words so a stale file is rejected
+        without unpickling the word list.
+        """
+        memo = self._memo.get(path)
+        if memo is not None and memo[0] == key:
+            return memo[1]
+        if not self._uses_disk_cache(path):
+            return None
+
+        cache_path = self._cache_path(path)
+        try:
+            with open(cache_path, "rb") as f:
+                if pickle.load(f) != key:
+                    return None
+                words = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable vocabulary cache %s: %s", cache_path, e)
+            return None
+
+        self._memo[path] = (key, words)
+        logger.debug("Loaded %d words for %s from cache", len(words), path.name)
+        return words
+
+    def _write_cache(self, path: Path, key: tuple, words: List[Dict[str, Any]]) -> None:
+        """Write the pickle cache for path atomically (failures are only logged)"""
+        cache_path = self._cache_path(path)
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(words, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write vocabulary cache %s: %s", cache_path, e)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
     @log_exception(logger)
     def _load_json(self, path: Path) -> List[Dict[str, Any]]:
@@ -121,8 +343,7 @@ class VocabLoader:
             ]
         }
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(path)
 
         # Support both wrapped and direct array formats
         if isinstance(data, dict) and "words" in data:
@@ -134,13 +355,32 @@ class VocabLoader:
         else:
             raise ValueError("Invalid JSON format: expected object with 'words' or array")
 
-        # Validate and normalize
-        validated = []
-        for i, word_data in enumerate(words):
-            try:
-                validated.append(self._validate_word_entry(word_data))
-            except ValueError as e:
-                logger.warning(f"Skipping word at index {i}: {e}")
+        validated = self._validate_batch(words)
+
+        logger.info(f"Loaded {len(validated)} words from {path.name}")
+        return validated
+
+    @log_exception(logger)
+    def _load_jsonl(self, path: Path) -> List[Dict[str, Any]]:
+        """
+        Load vocabulary from JSON Lines file.
+
+        Expected format (one JSON value per line, meta line optional):
+        {"meta": {...}}
+        {"word": "abandon", "definition": "v. 遗弃；放弃", ...}
+        ...
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(path, "rb") as f:
+            words = [loads(line) for line in f if not line.isspace()]
+
+        if words and type(words[0]) is dict and "meta" in words[0] and "word" not in words[0]:
+            meta = words[0]["meta"]
+            del words[0]
+            if isinstance(meta, dict):
+                logger.info(f"Loading vocabulary: {meta.get('name', path.name)}")
+
+        validated = self._validate_batch(words)
 
         logger.info(f"Loaded {len(validated)} words from {path.name}")
         return validated
@@ -155,31 +395,48 @@ class VocabLoader:
         abandon,v. 遗弃；放弃,/əˈbændən/,He decided to abandon the project.,4,3,verb
         """
         words = []
+        append = words.append
+        validate = self._validate_word_entry
 
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8", newline="") as f:
             # Detect delimiter
             first_line = f.readline()
             f.seek(0)
 
-            if "\t" in first_line:
-                import csv
-                reader = csv.DictReader(f, delimiter="\t")
-            else:
-                import csv
-                reader = csv.DictReader(f)
+            reader = csv.reader(f, delimiter="\t" if "\t" in first_line else ",")
+            header = next(reader, None) or []
+
+            # Column positions resolved once from the header; plain tuples
+            # per row avoid building a DictReader dict for every line
+            columns = {name: i for i, name in enumerate(header)}
+            text_fields = [
+                (field, columns.get(field))
+                for field in ("word", "definition", "phonetic", "example", "category")
+            ]
+            difficulty_col = columns.get("difficulty")
+            frequency_col = columns.get("frequency")
 
             for row in reader:
-                word_data = {
-                    "word": row.get("word", "").strip(),
-                    "definition": row.get("definition", "").strip(),
-                    "phonetic": row.get("phonetic", "").strip() or None,
-                    "example": row.get("example", "").strip() or None,
-                    "difficulty": self._parse_int(row.get("difficulty", self.DEFAULT_DIFFICULTY)),
-                    "frequency": self._parse_int(row.get("frequency", self.DEFAULT_FREQUENCY)),
-                    "category": row.get("category", "").strip() or None,
-                }
+                if not row:
+                    continue  # Blank line
+                size = len(row)
+
+                word_data = {}
+                for field, col in text_fields:
+                    value = row[col].strip() if col is not None and col < size else ""
+                    word_data[field] = value or None
+                # Integers are parsed and clamped once, by _validate_word_entry
+                word_data["difficulty"] = (
+                    row[difficulty_col] if difficulty_col is not None and difficulty_col < size
+                    else self.DEFAULT_DIFFICULTY
+                )
+                word_data["frequency"] = (
+                    row[frequency_col] if frequency_col is not None and frequency_col < size
+                    else self.DEFAULT_FREQUENCY
+                )
+
                 try:
-                    words.append(self._validate_word_entry(word_data))
+                    append(validate(word_data))
                 except ValueError as e:
                     logger.warning(f"Skipping word {word_data.get('word')}: {e}")
 
@@ -201,31 +458,43 @@ class VocabLoader:
         ability - n. 能力；才能
         """
         words = []
-
-        with open(path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith("#"):  # Skip empty and comments
-                    continue
-
-                # Try to parse as "word - definition" format
-                if " - " in line:
-                    word, definition = line.split(" - ", 1)
-                    word_data = {
-                        "word": word.strip(),
-                        "definition": definition.strip(),
-                    }
-                else:
-                    # Just the word
-                    word_data = {
-                        "word": line,
-                        "definition": "",  # Will need to be filled later
-                    }
-
-                try:
-                    words.append(self._validate_word_entry(word_data))
-                except ValueError as e:
-                    logger.warning(f"Skipping line {line_num}: {e}")
+        append = words.append
+
+        # TXT entries only carry word and definition, so the rest of each
+        # validated entry is fixed: resolve it once instead of running
+        # _validate_word_entry per line
+        difficulty = self._parse_int(self.DEFAULT_DIFFICULTY, min_val=1, max_val=10)
+        frequency = self._parse_int(self.DEFAULT_FREQUENCY, min_val=1)
+
+        # One read and split instead of per-line file iteration; read_text
+        # applies universal newlines, so splitting on "\n" matches it
+        lines = path.read_text(encoding="utf-8").split("\n")
+
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line[0] == "#":  # Skip empty and comments
+                continue
+
+            # Parse "word - definition"; a bare word has no definition yet
+            word, sep, definition = line.partition(" - ")
+            if sep:
+                word = word.strip()
+                definition = definition.strip()
+
+            if not word or not definition:
+                field = "word" if not word else "definition"
+                logger.warning(f"Skipping line {line_num}: Missing required field: {field}")
+                continue
+
+            append({
+                "word": word,
+                "definition": definition,
+                "phonetic": None,
+                "example": None,
+                "difficulty": difficulty,
+                "frequency": frequency,
+                "category": None,
+            })
 
         logger.info(f"Loaded {len(words)} words from TXT: {path.name}")
         return words
@@ -243,38 +512,106 @@ class VocabLoader:
         Raises:
             ValueError: If required fields are missing
         """
-        # Check required fields
-        for field in self.REQUIRED_JSON_FIELDS:
-            if field not in word_data or not word_data[field]:
-                raise ValueError(f"Missing required field: {field}")
+        # Each field is looked up once; a missing or empty required field
+        # fails the same check
+        get = word_data.get
+        word = get("word")
+        definition = get("definition")
+        if not word or not definition:
+            raise ValueError(f"Missing required field: {'word' if not word else 'definition'}")
+
+        phonetic = get("phonetic")
+        example = get("example")
+        category = get("category")
 
         # Normalize and validate
-        validated = {
-            "word": word_data["word"].strip(),
-            "definition": word_data["definition"].strip(),
-            "phonetic": word_data.get("phonetic", "").strip() if word_data.get("phonetic") else None,
-            "example": word_data.get("example", "").strip() if word_data.get("example") else None,
+        return {
+            "word": word.strip(),
+            "definition": definition.strip(),
+            "phonetic": phonetic.strip() if phonetic else None,
+            "example": example.strip() if example else None,
             "difficulty": self._parse_int(
-                word_data.get("difficulty", self.DEFAULT_DIFFICULTY),
+                get("difficulty", self.DEFAULT_DIFFICULTY),
                 min_val=1,
                 max_val=10
             ),
             "frequency": self._parse_int(
-                word_data.get("frequency", self.DEFAULT_FREQUENCY),
+                get("frequency", self.DEFAULT_FREQUENCY),
                 min_val=1
             ),
-            "category": word_data.get("category", "").strip() if word_data.get("category") else None,
+            "category": category.strip() if category else None,
         }
 
-        return validated
+    def _validate_batch(self, words: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Validate and normalize a list of word entries in place.
+
+        Same result as calling _validate_word_entry on each entry, with the
+        per-entry work for dict entries inlined. Each raw entry is replaced
+        (and freed) as soon as it is validated, so raw and validated copies
+        of the whole list never coexist.
+
+        Args:
+            words: Raw word entries (modified in place)
+
+        Returns:
+            Validated entries, with invalid ones skipped
+        """
+        parse_int = self._parse_int
+        default_difficulty = self.DEFAULT_DIFFICULTY
+        default_frequency = self.DEFAULT_FREQUENCY
+        skipped = False
+
+        for i, word_data in enumerate(words):
+            if type(word_data) is not dict:
+                try:
+                    words[i] = self._validate_word_entry(word_data)
+                except ValueError as e:
+                    logger.warning(f"Skipping word at index {i}: {e}")
+                    words[i] = None
+                    skipped = True
+                continue
+
+            get = word_data.get
+            word = get("word")
+            definition = get("definition")
+            if not word or not definition:
+                field = "word" if not word else "definition"
+                logger.warning(f"Skipping word at index {i}: Missing required field: {field}")
+                words[i] = None
+                skipped = True
+                continue
+
+            phonetic = get("phonetic")
+            example = get("example")
+            category = get("category")
+            difficulty = get("difficulty", default_difficulty)
+            frequency = get("frequency", default_frequency)
+
+            words[i] = {
+                "word": word.strip(),
+                "definition": definition.strip(),
+                "phonetic": phonetic.strip() if phonetic else None,
+                "example": example.strip() if example else None,
+                "difficulty": parse_int(difficulty, 1, 10),
+                "frequency": parse_int(frequency, 1),
+                "category": category.strip() if category else None,
+            }
+
+        return [w for w in words if w is not None] if skipped else words
 
     def _parse_int(self, value: Any, min_val: int = 1, max_val: int = 100) -> int:
         """Parse integer with bounds checking"""
-        try:
+        if type(value) is int:  # Already an int (the JSON case): just clamp
+            parsed = value
+        elif type(value) is str and value.isdecimal():  # Plain digits (the CSV case)
             parsed = int(value)
-            return max(min_val, min(parsed, max_val))
-        except (ValueError, TypeError):
-            return min_val
+        else:
+            try:
+                parsed = int(value)
+            except (ValueError, TypeError):
+                return min_val
+        return min_val if parsed < min_val else max_val if parsed > max_val else parsed
 
     @log_exception(logger)
     def validate_format(self, file_path: str) -> bool:
@@ -302,30 +639,33 @@ class VocabLoader:
         Returns:
             List of dictionaries with 'name', 'path', 'format', 'info'
         """
-        vocabularies = []
-
-        for path in self.vocab_dir.iterdir():
-            if path.is_file() and path.suffix.lower() in [".json", ".csv", ".txt"]:
-                # Try to read metadata for JSON files
-                info = {}
-                if path.suffix.lower() == ".json":
-                    try:
-                        with open(path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            if isinstance(data, dict) and "meta" in data:
-                                info = data["meta"]
-                    except Exception:
-                        pass
-
-                vocabularies.append({
-                    "name": path.stem,
-                    "path": str(path),
-                    "format": path.suffix[1:].upper(),
-                    "info": info
-                })
+        paths = [
+            path for path in self.vocab_dir.iterdir()
+            if path.is_file() and path.suffix.lower() in [".json", ".jsonl", ".csv", ".txt"]
+        ]
+
+        # Read metadata for JSON files; the reads are I/O-bound, so several
+        # files are read concurrently
+        json_paths = [path for path in paths if path.suffix.lower() in (".json", ".jsonl")]
+        if len(json_paths) > 1:
+            workers = min(META_READ_WORKERS, len(json_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                infos = dict(zip(json_paths, executor.map(_try_read_json_meta, json_paths)))
+        else:
+            infos = {path: _try_read_json_meta(path) for path in json_paths}
+
+        vocabularies = [
+            {
+                "name": path.stem,
+                "path": str(path),
+                "format": path.suffix[1:].upper(),
+                "info": infos.get(path, {})
+            }
+            for path in paths
+        ]
 
         # Sort by name
-        vocabularies.sort(key=lambda x: x["name"])
+        vocabularies.sort(key=itemgetter("name"))
         return vocabularies
 
     @log_exception(logger)
@@ -346,21 +686,68 @@ class VocabLoader:
         Returns:
             True if successful
         """
-        output = {
-            "meta": meta or {
-                "name": "Exported Vocabulary",
-                "version": "1.0",
-                "total_words": len(words)
-            },
-            "words": words
+        meta = meta or {
+            "name": "Exported Vocabulary",
+            "version": "1.0",
+            "total_words": len(words)
+        }
+
+        path = Path(output_path)
+        if not path.is_absolute():
+            path = self.vocab_dir / path
+
+        # Written piecewise, one compact word object per line: each entry
+        # goes through the C encoder on its own (json's indent= mode falls
+        # back to the pure-Python encoder) and the serialized file is never
+        # held in memory at once. "meta" stays first for _read_json_meta.
+        dumps = _dumps_json
+        last = len(words) - 1
+        with open(path, "wb") as f:
+            f.write(b'{\n  "meta": ' + dumps(meta) + b',\n  "words": [\n')
+            for i, word in enumerate(words):
+                f.write(b"    " + dumps(word) + (b",\n" if i < last else b"\n"))
+            f.write(b"  ]\n}\n")
+
+        logger.info(f"Exported {len(words)} words to {path}")
+        return True
+
+    @log_exception(logger)
+    def export_to_ndjson(
+        self,
+        words: List[Dict[str, Any]],
+        output_path: str,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Export vocabulary list to a JSON Lines (.jsonl) file.
+
+        Writes a {"meta": ...} line followed by one word object per line,
+        so the file can be read back (or consumed by streaming tools) one
+        line at a time.
+
+        Args:
+            words: List of word dictionaries
+            output_path: Output file path
+            meta: Optional metadata dictionary
+
+        Returns:
+            True if successful
+        """
+        meta = meta or {
+            "name": "Exported Vocabulary",
+            "version": "1.0",
+            "total_words": len(words)
         }
 
         path = Path(output_path)
         if not path.is_absolute():
             path = self.vocab_dir / path
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        dumps = _dumps_json
+        with open(path, "wb") as f:
+            f.write(dumps({"meta": meta}) + b"\n")
+            for word in words:
+                f.write(dumps(word) + b"\n")
 
         logger.info(f"Exported {len(words)} words to {path}")
         return True
@@ -0,0 +1,23 @@
+"""
+Shared helpers for the model dataclasses
+"""
+
+
+def derived_slots(*names: str) -> type:
+    """
+    Base class adding slots for state derived from a model's fields.
+
+    @dataclass(slots=True) only creates slots for fields, so a lookup index
+    or similar cache would otherwise have to be declared as a field and
+    would then show up in fields(), asdict() and astuple() next to the
+    real data. Slots inherited from a base class are not fields, so
+    models subclass derived_slots("_index", ...) and fill them in
+    __post_init__; copy and pickle still carry them.
+
+    Args:
+        names: Slot names to add
+
+    Returns:
+        A plain base class declaring just those slots
+    """
+    return type("DerivedSlots", (), {"__slots__": names})
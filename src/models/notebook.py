@@ -8,6 +8,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
+from itertools import islice
+
+from src.models.base import derived_slots
 
 
 class NotebookType(Enum):
@@ -18,22 +21,25 @@ class NotebookType(Enum):
     @classmethod
     def from_string(cls, value: str) -> "NotebookType":
         """Create NotebookType from string value"""
-        for nb_type in cls:
-            if nb_type.value == value.lower():
-                return nb_type
-        return cls.MISTAKE
+        return _NOTEBOOK_TYPES_BY_VALUE.get(value.lower(), cls.MISTAKE)
 
-    @classmethod
-    def display_name(cls, notebook_type: str) -> str:
+    @staticmethod
+    def display_name(notebook_type: str) -> str:
         """Get display name for a notebook type"""
-        names = {
-            cls.MISTAKE.value: "错题本",
-            cls.NEW_WORD.value: "生词本",
-        }
-        return names.get(notebook_type, notebook_type)
+        return _NOTEBOOK_TYPE_NAMES.get(notebook_type, notebook_type)
+
 
+# Display names by stored value
+_NOTEBOOK_TYPE_NAMES = {
+    NotebookType.MISTAKE.value: "错题本",
+    NotebookType.NEW_WORD.value: "生词本",
+}
 
-@dataclass
+# Members by stored value, for from_string
+_NOTEBOOK_TYPES_BY_VALUE = {member.value: member for member in NotebookType}
+
+
+@dataclass(slots=True)
 class NotebookEntry:
     """
     Base class for notebook entries.
@@ -77,7 +83,7 @@ class NotebookEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MistakeEntry(NotebookEntry):
     """
     Entry in the mistake book (错题本).
@@ -91,7 +97,7 @@ class MistakeEntry(NotebookEntry):
         self.notebook_type = NotebookType.MISTAKE
 
 
-@dataclass
+@dataclass(slots=True)
 class NewWordEntry(NotebookEntry):
     """
     Entry in the new word book (生词本).
@@ -105,7 +111,7 @@ class NewWordEntry(NotebookEntry):
         self.notebook_type = NotebookType.NEW_WORD
 
 
-@dataclass
+@dataclass(slots=True)
 class NotebookEntryDetail:
     """
     Detailed view of a notebook entry with word information.
@@ -141,20 +147,32 @@ class NotebookEntryDetail:
         }
 
 
-@dataclass
-class Notebook:
+@dataclass(slots=True)
+class Notebook(derived_slots("_by_word_record")):
     """
     A collection of notebook entries for a user.
 
     Attributes:
         user_id: User ID
-        entries: List of notebook entries
+        entries: List of notebook entries (modify through add_entry /
+            remove_entry so the lookup index stays in sync)
         notebook_type: Type of notebook
     """
     user_id: int
     entries: List[NotebookEntry] = field(default_factory=list)
     notebook_type: NotebookType = NotebookType.MISTAKE
 
+    def __post_init__(self):
+        """Index the initial entries by word record ID"""
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Index entries by word record ID (first entry wins)"""
+        index = {}
+        for entry in self.entries:
+            index.setdefault(entry.word_record_id, entry)
+        self._by_word_record = index
+
     def __len__(self) -> int:
         """Get total number of entries"""
         return len(self.entries)
@@ -174,10 +192,10 @@ class Notebook:
             True if added, False if already exists
         """
         # Check if entry already exists
-        for existing in self.entries:
-            if existing.word_record_id == entry.word_record_id:
-                return False
+        if entry.word_record_id in self._by_word_record:
+            return False
 
+        self._by_word_record[entry.word_record_id] = entry
         self.entries.append(entry)
         return True
 
@@ -191,18 +209,31 @@ class Notebook:
         Returns:
             True if removed, False if not found
         """
-        for i, entry in enumerate(self.entries):
-            if entry.word_record_id == word_record_id:
-                self.entries.pop(i)
-                return True
-        return False
+        entry = self._by_word_record.pop(word_record_id, None)
+        if entry is None:
+            return False
+
+        entries = self.entries
+        for i, existing in enumerate(entries):
+            if existing is entry:
+                del entries[i]
+                break
+        else:
+            # entries was changed directly and no longer holds the indexed
+            # entry; dropping it from the index is all that is left to do
+            return False
+
+        # Entries passed to the constructor may repeat a word record ID;
+        # any later duplicate becomes the indexed entry
+        for existing in islice(entries, i, None):
+            if existing.word_record_id == word_record_id:
+                self._by_word_record[word_record_id] = existing
+                break
+        return True
 
     def get_entry_by_word_record(self, word_record_id: int) -> Optional[NotebookEntry]:
         """Get an entry by word record ID"""
-        for entry in self.entries:
-            if entry.word_record_id == word_record_id:
-                return entry
-        return None
+        return self._by_word_record.get(word_record_id)
 
     def sort_by_date(self, descending: bool = True) -> None:
         """Sort entries by creation date"""
@@ -210,6 +241,8 @@ class Notebook:
             key=lambda e: e.created_at,
             reverse=descending
         )
+        # Keep the index pointing at the first entry per ID in the new order
+        self._rebuild_index()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -224,6 +257,8 @@ class Notebook:
 class MistakeBook(Notebook):
     """Specialized notebook for mistakes"""
 
+    __slots__ = ()
+
     def __init__(self, user_id: int):
         super().__init__(user_id, notebook_type=NotebookType.MISTAKE)
 
@@ -231,5 +266,7 @@ class MistakeBook(Notebook):
 class NewWordBook(Notebook):
     """Specialized notebook for new words"""
 
+    __slots__ = ()
+
     def __init__(self, user_id: int):
         super().__init__(user_id, notebook_type=NotebookType.NEW_WORD)
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
+from src.models.base import derived_slots
+
 
 class SessionType(Enum):
     """Type of session"""
@@ -19,24 +21,27 @@ class SessionType(Enum):
     @classmethod
     def from_string(cls, value: str) -> "SessionType":
         """Create SessionType from string value"""
-        for session_type in cls:
-            if session_type.value == value.lower():
-                return session_type
-        return cls.STUDY
+        return _SESSION_TYPES_BY_VALUE.get(value.lower(), cls.STUDY)
 
-    @classmethod
-    def display_name(cls, session_type: str) -> str:
+    @staticmethod
+    def display_name(session_type: str) -> str:
         """Get display name for a session type"""
-        names = {
-            cls.STUDY.value: "学习",
-            cls.TEST.value: "测试",
-            cls.REVIEW.value: "复习",
-        }
-        return names.get(session_type, session_type)
+        return _SESSION_TYPE_NAMES.get(session_type, session_type)
+
 
+# Display names by stored value
+_SESSION_TYPE_NAMES = {
+    SessionType.STUDY.value: "学习",
+    SessionType.TEST.value: "测试",
+    SessionType.REVIEW.value: "复习",
+}
 
-@dataclass
-class StudySession:
+# Members by stored value, for from_string
+_SESSION_TYPES_BY_VALUE = {member.value: member for member in SessionType}
+
+
+@dataclass(slots=True)
+class StudySession(derived_slots("_vocab_set")):
     """
     Record of a study session.
 
@@ -49,7 +54,8 @@ class StudySession:
         words_studied: Number of words studied
         words_correct: Number of correct answers
         total_attempts: Total answer attempts
-        vocabulary_ids: List of vocabulary IDs studied
+        vocabulary_ids: List of vocabulary IDs studied (modify through
+            add_vocabulary so the membership set stays in sync)
     """
     id: Optional[int]
     user_id: int
@@ -61,6 +67,11 @@ class StudySession:
     total_attempts: int = 0
     vocabulary_ids: List[int] = field(default_factory=list)
 
+    def __post_init__(self):
+        """Index the initial vocabulary IDs"""
+        # Set of vocabulary_ids, for O(1) membership checks
+        self._vocab_set = set(self.vocabulary_ids)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -134,12 +145,13 @@ class StudySession:
 
     def add_vocabulary(self, vocab_id: int) -> None:
         """Add a vocabulary ID to the session"""
-        if vocab_id not in self.vocabulary_ids:
+        if vocab_id not in self._vocab_set:
+            self._vocab_set.add(vocab_id)
             self.vocabulary_ids.append(vocab_id)
             self.words_studied = len(self.vocabulary_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestQuestion:
     """
     A test question for a vocabulary word.
@@ -180,7 +192,7 @@ class TestQuestion:
     def _check_answer(self, answer: str) -> bool:
         """Check if the answer is correct"""
         # Case-insensitive comparison
-        return answer.strip().lower() == self.correct_answer.strip().lower()
+        return answer.strip().casefold() == self.correct_answer.strip().casefold()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -195,7 +207,7 @@ class TestQuestion:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """
     Result summary for a test session.
@@ -6,7 +6,7 @@ Represents a user with their proficiency level and learning statistics.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from enum import Enum
 
 from config import config
@@ -21,43 +21,53 @@ class UserLevel(Enum):
     CET6 = "cet6"              # 六级
 
     @classmethod
-    def all(cls) -> List[str]:
+    def all(cls) -> list[str]:
         """Get all available level values"""
-        return [e.value for e in cls]
+        return list(_LEVEL_VALUES)  # Copy, so callers may modify it
 
     @classmethod
     def from_string(cls, value: str) -> "UserLevel":
         """Create UserLevel from string value"""
-        for level in cls:
-            if level.value == value.lower():
-                return level
-        return cls.ELEMENTARY
+        return _LEVELS_BY_VALUE.get(value.lower(), cls.ELEMENTARY)
 
-    @classmethod
-    def display_name(cls, level: str) -> str:
+    @staticmethod
+    def display_name(level: str) -> str:
         """Get display name for a level"""
-        names = {
-            cls.ELEMENTARY.value: "小学",
-            cls.MIDDLE.value: "初中",
-            cls.HIGH.value: "高中",
-            cls.CET4.value: "大学英语四级",
-            cls.CET6.value: "大学英语六级",
-        }
-        return names.get(level, level)
+        return _LEVEL_NAMES.get(level, level)
 
     def difficulty_range(self) -> tuple[int, int]:
         """Get recommended difficulty range for this level"""
-        ranges = {
-            self.ELEMENTARY: (1, 3),
-            self.MIDDLE: (2, 5),
-            self.HIGH: (3, 7),
-            self.CET4: (4, 8),
-            self.CET6: (6, 10),
-        }
-        return ranges.get(self, (1, 10))
+        return self._range
+
+
+# Display names by stored value
+_LEVEL_NAMES = {
+    UserLevel.ELEMENTARY.value: "小学",
+    UserLevel.MIDDLE.value: "初中",
+    UserLevel.HIGH.value: "高中",
+    UserLevel.CET4.value: "大学英语四级",
+    UserLevel.CET6.value: "大学英语六级",
+}
+
+# Members by stored value, for from_string
+_LEVELS_BY_VALUE = {member.value: member for member in UserLevel}
+
+# Stored values in declaration order, for all()
+_LEVEL_VALUES = tuple(_LEVELS_BY_VALUE)
+
+# Recommended difficulty range per level, for difficulty_range
+for _level, _range in (
+    (UserLevel.ELEMENTARY, (1, 3)),
+    (UserLevel.MIDDLE, (2, 5)),
+    (UserLevel.HIGH, (3, 7)),
+    (UserLevel.CET4, (4, 8)),
+    (UserLevel.CET6, (6, 10)),
+):
+    _level._range = _range
+del _level, _range
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User entity representing a learner.
@@ -88,12 +98,14 @@ class User:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "User":
         """Create User from dictionary"""
+        get = data.get
+        created_at = get("created_at")
         return cls(
-            id=data.get("id"),
+            id=get("id"),
             name=data["name"],
-            level=UserLevel.from_string(data.get("level", "elementary")),
-            rating=data.get("rating", config.ELO_INITIAL_RATING),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
+            level=UserLevel.from_string(get("level", "elementary")),
+            rating=get("rating", config.ELO_INITIAL_RATING),
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
         )
 
     @property
@@ -124,7 +136,7 @@ class User:
         return min_diff <= difficulty <= max_diff
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
     """
     User learning statistics.
@@ -4,9 +4,14 @@ Vocabulary model for EnglishStudy application
 Represents a vocabulary word with its metadata.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from enum import Enum
+from bisect import bisect_left
+from operator import itemgetter
+
+from src.models.base import derived_slots
 
 
 class WordCategory(Enum):
@@ -25,31 +30,33 @@ class WordCategory(Enum):
     @classmethod
     def from_string(cls, value: str) -> "WordCategory":
         """Create WordCategory from string value"""
-        value_lower = value.lower()
-        for category in cls:
-            if category.value == value_lower:
-                return category
-        return cls.OTHER
+        return _CATEGORIES_BY_VALUE.get(value.lower(), cls.OTHER)
 
-    @classmethod
-    def display_name(cls, category: str) -> str:
+    @staticmethod
+    def display_name(category: str) -> str:
         """Get display name for a category"""
-        names = {
-            cls.NOUN.value: "名词",
-            cls.VERB.value: "动词",
-            cls.ADJECTIVE.value: "形容词",
-            cls.ADVERB.value: "副词",
-            cls.PRONOUN.value: "代词",
-            cls.PREPOSITION.value: "介词",
-            cls.CONJUNCTION.value: "连词",
-            cls.INTERJECTION.value: "感叹词",
-            cls.PHRASE.value: "短语",
-            cls.OTHER.value: "其他",
-        }
-        return names.get(category.lower(), category)
+        return _CATEGORY_NAMES.get(category.lower(), category)
+
+
+# Display names by stored value
+_CATEGORY_NAMES = {
+    WordCategory.NOUN.value: "名词",
+    WordCategory.VERB.value: "动词",
+    WordCategory.ADJECTIVE.value: "形容词",
+    WordCategory.ADVERB.value: "副词",
+    WordCategory.PRONOUN.value: "代词",
+    WordCategory.PREPOSITION.value: "介词",
+    WordCategory.CONJUNCTION.value: "连词",
+    WordCategory.INTERJECTION.value: "感叹词",
+    WordCategory.PHRASE.value: "短语",
+    WordCategory.OTHER.value: "其他",
+}
+
+# Members by stored value, for from_string
+_CATEGORIES_BY_VALUE = {member.value: member for member in WordCategory}
 
 
-@dataclass
+@dataclass(slots=True)
 class Vocabulary:
     """
     Vocabulary entity representing a word.
@@ -79,6 +86,9 @@ class Vocabulary:
         self.difficulty = max(1, min(10, self.difficulty))
         # Ensure frequency is at least 1
         self.frequency = max(1, self.frequency)
+        # Categories repeat across a whole set; share one string per value
+        if self.category:
+            self.category = sys.intern(self.category)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -96,15 +106,16 @@ class Vocabulary:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Vocabulary":
         """Create Vocabulary from dictionary"""
+        get = data.get
         return cls(
-            id=data.get("id"),
+            id=get("id"),
             word=data["word"],
-            phonetic=data.get("phonetic"),
-            definition=data.get("definition", ""),
-            example=data.get("example"),
-            difficulty=data.get("difficulty", 1),
-            frequency=data.get("frequency", 1),
-            category=data.get("category"),
+            phonetic=get("phonetic"),
+            definition=get("definition", ""),
+            example=get("example"),
+            difficulty=get("difficulty", 1),
+            frequency=get("frequency", 1),
+            category=get("category"),
         )
 
     @property
@@ -128,8 +139,8 @@ class Vocabulary:
         return min_diff <= self.difficulty <= max_diff
 
 
-@dataclass
-class VocabularySet:
+@dataclass(slots=True)
+class VocabularySet(derived_slots("_word_index", "_prefix_index")):
     """
     A collection of vocabulary words (a vocabulary book).
 
@@ -137,7 +148,9 @@ class VocabularySet:
         name: Name of the vocabulary set
         description: Description of the vocabulary set
         level: Target user level
-        words: List of vocabulary words
+        words: List of vocabulary words (the lookup indexes are rebuilt
+            when it is replaced or resized; editing a word's text in
+            place is not noticed)
     """
     name: str
     words: list[Vocabulary] = field(default_factory=list)
@@ -145,6 +158,15 @@ class VocabularySet:
     level: str = ""
     version: str = "1.0"
 
+    def __post_init__(self):
+        """Start without indexes (built on first use)"""
+        # Each index is stored as (words, len(words), index) so _cached can
+        # tell when words was replaced or resized behind the set's back.
+        # First word per lower-cased text, for get_word_by_text
+        self._word_index = None
+        # (lower-cased texts, words) sorted by text, for prefix_search
+        self._prefix_index = None
+
     def __len__(self) -> int:
         """Get total number of words"""
         return len(self.words)
@@ -153,20 +175,70 @@ class VocabularySet:
         """Allow iteration over words"""
         return iter(self.words)
 
+    def _cached(self, entry: Optional[tuple]) -> Any:
+        """Return the index held by a cache entry, or None if words changed since"""
+        if entry is not None and entry[0] is self.words and entry[1] == len(self.words):
+            return entry[2]
+        return None
+
+    def add_word(self, vocab: Vocabulary) -> None:
+        """Append a word to the set"""
+        words = self.words
+        index = self._cached(self._word_index)
+        words.append(vocab)
+        if index is not None:
+            index.setdefault(vocab.word.lower(), vocab)
+            self._word_index = (words, len(words), index)
+        # The prefix index is rebuilt on the next search (words grew)
+
     def filter_by_difficulty(self, min_diff: int, max_diff: int) -> list[Vocabulary]:
         """Filter words by difficulty range"""
-        return [
-            w for w in self.words
-            if w.matches_difficulty(min_diff, max_diff)
-        ]
+        # A straight scan: difficulty can be edited on the words themselves,
+        # which a cached index would not notice
+        return [v for v in self.words if min_diff <= v.difficulty <= max_diff]
 
     def get_word_by_text(self, word: str) -> Optional[Vocabulary]:
         """Find a word by its text (case-insensitive)"""
-        word_lower = word.lower()
-        for vocab in self.words:
-            if vocab.word.lower() == word_lower:
-                return vocab
-        return None
+        index = self._cached(self._word_index)
+        if index is None:
+            words = self.words
+            # Built from the end so the first of any duplicates wins
+            index = {v.word.lower(): v for v in reversed(words)}
+            self._word_index = (words, len(words), index)
+        return index.get(word.lower())
+
+    def prefix_search(self, prefix: str, limit: Optional[int] = None) -> List[Vocabulary]:
+        """
+        Find words starting with a prefix (case-insensitive).
+
+        Uses a sorted index built on the first call (and again after words
+        changes size), so each search is a binary search plus a scan of
+        the matches.
+
+        Args:
+            prefix: Text the words should start with
+            limit: Maximum number of words to return (default: all)
+
+        Returns:
+            Matching words, ordered by lower-cased text
+        """
+        index = self._cached(self._prefix_index)
+        if index is None:
+            pairs = sorted(
+                ((v.word.lower(), v) for v in self.words),
+                key=itemgetter(0)
+            )
+            index = ([p[0] for p in pairs], [p[1] for p in pairs])
+            self._prefix_index = (self.words, len(self.words), index)
+        keys, words = index
+
+        prefix = prefix.lower()
+        start = bisect_left(keys, prefix)
+        end = start
+        stop = len(keys) if limit is None else min(len(keys), start + limit)
+        while end < stop and keys[end].startswith(prefix):
+            end += 1
+        return words[start:end]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (for JSON export)"""
@@ -178,7 +250,7 @@ class VocabularySet:
                 "version": self.version,
                 "total_words": len(self.words),
             },
-            "words": [w.to_dict() for w in self.words],
+            "words": list(map(Vocabulary.to_dict, self.words)),
         }
 
     @classmethod
@@ -192,5 +264,5 @@ class VocabularySet:
             description=meta.get("description", ""),
             level=meta.get("level", ""),
             version=meta.get("version", "1.0"),
-            words=[Vocabulary.from_dict(w) for w in words_data],
+            words=list(map(Vocabulary.from_dict, words_data)),
         )
@@ -6,7 +6,7 @@ Tracks a user's learning progress for individual words.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable
 from enum import Enum
 
 from config import config
@@ -22,26 +22,17 @@ class MemoryStatus(Enum):
     @classmethod
     def all(cls) -> list[str]:
         """Get all status values"""
-        return [e.value for e in cls]
+        return list(_STATUS_VALUES)  # Copy, so callers may modify it
 
     @classmethod
     def from_string(cls, value: str) -> "MemoryStatus":
         """Create MemoryStatus from string value"""
-        for status in cls:
-            if status.value == value.lower():
-                return status
-        return cls.UNKNOWN
+        return _STATUSES_BY_VALUE.get(value.lower(), cls.UNKNOWN)
 
-    @classmethod
-    def display_name(cls, status: str) -> str:
+    @staticmethod
+    def display_name(status: str) -> str:
         """Get display name for a status"""
-        names = {
-            cls.UNKNOWN.value: "未学习",
-            cls.EASY.value: "认识",
-            cls.MEDIUM.value: "模糊",
-            cls.HARD.value: "不认识",
-        }
-        return names.get(status, status)
+        return _STATUS_NAMES.get(status, status)
 
     def is_correct(self) -> bool:
         """Check if this status indicates correct recall"""
@@ -56,13 +47,38 @@ class MemoryStatus(Enum):
         - MEDIUM (模糊) -> 3 (hesitant but correct)
         - HARD (不认识) -> 1 (incorrect)
         """
-        scores = {
-            self.EASY: 5,
-            self.MEDIUM: 3,
-            self.HARD: 1,
-            self.UNKNOWN: 0,
-        }
-        return scores.get(self, 0)
+        return self._quality
+
+
+# Display names by stored value
+_STATUS_NAMES = {
+    MemoryStatus.UNKNOWN.value: "未学习",
+    MemoryStatus.EASY.value: "认识",
+    MemoryStatus.MEDIUM.value: "模糊",
+    MemoryStatus.HARD.value: "不认识",
+}
+
+# Members by stored value, for from_string
+_STATUSES_BY_VALUE = {member.value: member for member in MemoryStatus}
+
+# Stored values in declaration order, for all()
+_STATUS_VALUES = tuple(_STATUSES_BY_VALUE)
+
+
+# Stable ordinals (declaration order) for table-driven lookups
+for _ord, _status in enumerate(MemoryStatus):
+    _status._ord = _ord
+del _ord, _status
+
+# SM-2 quality score per status, for to_quality_score
+for _status, _quality in (
+    (MemoryStatus.UNKNOWN, 0),
+    (MemoryStatus.EASY, 5),
+    (MemoryStatus.MEDIUM, 3),
+    (MemoryStatus.HARD, 1),
+):
+    _status._quality = _quality
+del _status, _quality
 
 
 class WordState(Enum):
@@ -75,21 +91,41 @@ class WordState(Enum):
     @classmethod
     def from_string(cls, value: str) -> "WordState":
         """Create WordState from string value"""
-        for state in cls:
-            if state.value == value.lower():
-                return state
-        return cls.NEW
+        return _STATES_BY_VALUE.get(value.lower(), cls.NEW)
 
-    @classmethod
-    def display_name(cls, state: str) -> str:
+    @staticmethod
+    def display_name(state: str) -> str:
         """Get display name for a state"""
-        names = {
-            cls.NEW.value: "新词",
-            cls.LEARNING.value: "学习中",
-            cls.REVIEW.value: "复习中",
-            cls.MASTERED.value: "已掌握",
-        }
-        return names.get(state, state)
+        return _STATE_NAMES.get(state, state)
+
+
+# Display names by stored value
+_STATE_NAMES = {
+    WordState.NEW.value: "新词",
+    WordState.LEARNING.value: "学习中",
+    WordState.REVIEW.value: "复习中",
+    WordState.MASTERED.value: "已掌握",
+}
+
+# Members by stored value, for from_string
+_STATES_BY_VALUE = {member.value: member for member in WordState}
+
+
+for _ord, _state in enumerate(WordState):
+    _state._ord = _ord
+del _ord, _state
+
+
+def _build_next_table(transitions: Dict) -> tuple:
+    """
+    Flatten {state: {feedback: to_state}} into a tuple indexed by
+    state._ord * len(MemoryStatus) + feedback._ord (None where undefined)
+    """
+    return tuple(
+        transitions.get(state, {}).get(feedback)
+        for state in WordState
+        for feedback in MemoryStatus
+    )
 
 
 class StateMachine:
@@ -131,6 +167,10 @@ class StateMachine:
         },
     }
 
+    # Flat lookup table built from TRANSITIONS
+    _NEXT = _build_next_table(TRANSITIONS)
+    _N_FEEDBACK = len(MemoryStatus)
+
     @classmethod
     def next_state(
         cls,
@@ -147,10 +187,27 @@ class StateMachine:
         Returns:
             Next word state
         """
-        return cls.TRANSITIONS[current][feedback]
+        next_state = cls._NEXT[current._ord * cls._N_FEEDBACK + feedback._ord]
+        if next_state is None:
+            raise KeyError((current, feedback))
+        return next_state
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse a stored timestamp: unix epoch seconds (as stored in the
+    database) or an ISO format string (as written by to_dict).
+    """
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    # fromisoformat is implemented in C and beats slicing the string into
+    # int() calls by around 10x, so it stays the ISO parser
+    return datetime.fromisoformat(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class WordRecord:
     """
     Record tracking a user's progress with a specific word.
@@ -166,6 +223,7 @@ class WordRecord:
         next_review: Next review timestamp
         last_review: Last review timestamp
         state: Learning state
+        consecutive_count: Consecutive EASY answers in the current state
         created_at: Record creation timestamp
     """
     id: Optional[int]
@@ -178,10 +236,13 @@ class WordRecord:
     next_review: Optional[datetime] = None
     last_review: Optional[datetime] = None
     state: WordState = WordState.NEW
+    consecutive_count: int = 0
     created_at: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        next_review = self.next_review
+        last_review = self.last_review
         return {
             "id": self.id,
             "user_id": self.user_id,
@@ -190,27 +251,31 @@ class WordRecord:
             "easiness": self.easiness,
             "interval": self.interval,
             "repetitions": self.repetitions,
-            "next_review": self.next_review.isoformat() if self.next_review else None,
-            "last_review": self.last_review.isoformat() if self.last_review else None,
+            "next_review": next_review.isoformat() if next_review else None,
+            "last_review": last_review.isoformat() if last_review else None,
             "state": self.state.value,
+            "consecutive_count": self.consecutive_count,
             "created_at": self.created_at.isoformat(),
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "WordRecord":
         """Create WordRecord from dictionary"""
+        get = data.get
+        created_at = get("created_at")
         return cls(
-            id=data.get("id"),
+            id=get("id"),
             user_id=data["user_id"],
             vocabulary_id=data["vocabulary_id"],
-            status=MemoryStatus.from_string(data.get("status", "unknown")),
-            easiness=data.get("easiness", config.SRS_INITIAL_EASINESS),
-            interval=data.get("interval", 0),
-            repetitions=data.get("repetitions", 0),
-            next_review=datetime.fromisoformat(data["next_review"]) if data.get("next_review") else None,
-            last_review=datetime.fromisoformat(data["last_review"]) if data.get("last_review") else None,
-            state=WordState.from_string(data.get("state", "new")),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
+            status=MemoryStatus.from_string(get("status", "unknown")),
+            easiness=get("easiness", config.SRS_INITIAL_EASINESS),
+            interval=get("interval", 0),
+            repetitions=get("repetitions", 0),
+            next_review=_parse_timestamp(get("next_review")),
+            last_review=_parse_timestamp(get("last_review")),
+            state=WordState.from_string(get("state", "new")),
+            consecutive_count=get("consecutive_count") or 0,
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
         )
 
     def update_from_study(
@@ -256,6 +321,28 @@ class WordRecord:
         delta = self.next_review - datetime.now()
         return max(0, delta.days)
 
+    @staticmethod
+    def filter_due(
+        records: Iterable["WordRecord"],
+        now: Optional[datetime] = None
+    ) -> List["WordRecord"]:
+        """
+        Get the records that are due for review.
+
+        Same test as is_due, with the current time read once for the whole
+        batch rather than once per record.
+
+        Args:
+            records: Word records to check
+            now: Time to check against (default: current time)
+
+        Returns:
+            Due records, in their original order
+        """
+        if now is None:
+            now = datetime.now()
+        return [r for r in records if r.next_review is not None and now >= r.next_review]
+
     @property
     def status_display(self) -> str:
         """Get display name for current status"""
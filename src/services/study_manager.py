@@ -145,8 +145,7 @@ class StudyManager:
         max_review = max_review or config.DEFAULT_REVIEW_WORDS_PER_SESSION
 
         # Get due words for review
-        due_words_data = self.db.get_due_words(user.id)
-        due_words_data = due_words_data[:max_review]
+        due_words_data = self.db.get_due_words(user.id, max_review)
 
         # Get new words to learn
         new_words_data = self.db.get_new_words(user.id, max_new)
@@ -200,7 +199,9 @@ class StudyManager:
             )
 
         # Update state based on feedback
-        new_state = self.state_machine.next_state(record.state, feedback)
+        new_state, consecutive_count = self.state_machine.next_state(
+            record.state, feedback, record.consecutive_count
+        )
 
         # Update record in database
         self.db.update_word_record(
@@ -209,8 +210,9 @@ class StudyManager:
             new_easiness,
             new_interval,
             new_repetitions,
-            next_review.isoformat(),
-            new_state.value
+            int(next_review.timestamp()),
+            new_state.value,
+            consecutive_count
         )
 
         # Update user rating
@@ -84,27 +84,36 @@ class VocabularyManager:
         updated = 0
         errors = 0
 
-        for vocab in vocab_set.words:
-            try:
-                vocab_data = {
-                    "word": vocab.word,
-                    "phonetic": vocab.phonetic,
-                    "definition": vocab.definition,
-                    "example": vocab.example,
-                    "difficulty": vocab.difficulty,
-                    "frequency": vocab.frequency,
-                    "category": vocab.category,
-                }
-
-                vocab_id = self.db.insert_vocabulary(vocab_data)
-                if vocab_id is not None:
-                    imported += 1
-                else:
-                    updated += 1
-
-            except Exception as e:
-                logger.error(f"Failed to import word '{vocab.word}': {e}")
-                errors += 1
+        vocab_rows = [
+            {
+                "word": vocab.word,
+                "phonetic": vocab.phonetic,
+                "definition": vocab.definition,
+                "example": vocab.example,
+                "difficulty": vocab.difficulty,
+                "frequency": vocab.frequency,
+                "category": vocab.category,
+            }
+            for vocab in vocab_set.words
+        ]
+
+        try:
+            # One transaction for the whole set
+            imported = self.db.insert_vocabularies_bulk(vocab_rows)
+        except Exception as e:
+            # Fall back to per-word inserts so one bad entry doesn't sink the set
+            logger.warning(f"Bulk import failed ({e}), importing words individually")
+            for vocab_data in vocab_rows:
+                try:
+                    vocab_id = self.db.insert_vocabulary(vocab_data)
+                    if vocab_id is not None:
+                        imported += 1
+                    else:
+                        updated += 1
+
+                except Exception as e:
+                    logger.error(f"Failed to import word '{vocab_data['word']}': {e}")
+                    errors += 1
 
         stats = {
             "imported": imported,
@@ -541,7 +541,7 @@ class MainWindow(QMainWindow):
                     WHERE wr.user_id = ?
                       AND wr.vocabulary_id IN ({placeholders})
                       AND wr.next_review IS NOT NULL
-                      AND wr.next_review <= datetime('now')
+                      AND wr.next_review <= CAST(strftime('%s', 'now') AS INTEGER)
                       AND wr.state != 'mastered'
                     ORDER BY wr.next_review ASC
                     LIMIT ?
@@ -710,7 +710,7 @@ class MainWindow(QMainWindow):
             self,
             "导入词库",
             str(config.vocab_path),
-            "词库文件 (*.json *.csv *.txt);;所有文件 (*.*)"
+            "词库文件 (*.json *.jsonl *.csv *.txt);;所有文件 (*.*)"
         )
 
         if file_path:
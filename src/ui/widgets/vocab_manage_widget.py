@@ -249,7 +249,7 @@ class VocabManagerWidget(QWidget):
             self,
             "导入词库",
             "",
-            "词库文件 (*.json *.csv *.txt);;JSON 文件 (*.json);;CSV 文件 (*.csv);;文本文件 (*.txt);;所有文件 (*.*)"
+            "词库文件 (*.json *.jsonl *.csv *.txt);;JSON 文件 (*.json *.jsonl);;CSV 文件 (*.csv);;文本文件 (*.txt);;所有文件 (*.*)"
         )
 
         if not file_path:
@@ -0,0 +1,199 @@
+"""
+Unit tests for the SQLite database manager
+
+Tests the database layer including:
+- Connection pool reuse, rollback on release and exhaustion
+- Schema migration from older versions
+- Due-word queries on migrated data
+"""
+
+import sqlite3
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure import database
+from src.infrastructure.database import DatabaseManager
+
+
+class TestDatabaseManager:
+    """Test suite for DatabaseManager class"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Path for a fresh database file"""
+        return tmp_path / "study.db"
+
+    @pytest.fixture
+    def db(self, db_path):
+        """Create an initialized database manager, closed after the test"""
+        db = DatabaseManager(db_path=db_path)
+        assert db.init_database()
+        yield db
+        db.close_all()
+
+    @pytest.fixture
+    def local_tz(self, monkeypatch):
+        """Run the test in UTC+8 so local-time conversion is visible"""
+        monkeypatch.setenv("TZ", "CST-8")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    def test_pool_reuses_connection(self, db):
+        """Test a released connection is handed out again"""
+        with db.get_connection() as first:
+            pass
+        with db.get_connection() as second:
+            pass
+
+        assert second is first
+        assert db._created_connections == 1
+
+    def test_release_rolls_back(self, db):
+        """Test uncommitted changes are discarded when a connection is returned"""
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO users (name) VALUES ('uncommitted')")
+            assert conn.in_transaction
+
+        with db.get_connection() as conn:
+            assert not conn.in_transaction
+            count = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+        assert count == 0
+
+    def test_release_drops_unusable_connection(self, db):
+        """Test a connection that cannot roll back is closed, not pooled"""
+        with pytest.raises(ValueError):
+            with db.get_connection() as conn:
+                conn.execute("INSERT INTO users (name) VALUES ('lost')")
+                conn.close()
+                # The caller's error must surface, not the failed rollback
+                raise ValueError("caller error")
+
+        assert db._created_connections == 0
+        with db.get_connection() as fresh:
+            assert fresh is not conn
+            assert fresh.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0
+
+    def test_pool_exhaustion_times_out(self, db_path, monkeypatch):
+        """Test checkout waits for a free connection, then gives up"""
+        monkeypatch.setattr(
+            database, "config", replace(database.config, DB_POOL_SIZE=1, DB_TIMEOUT=0.05)
+        )
+        db = DatabaseManager(db_path=db_path)
+        try:
+            with db.get_connection():
+                with pytest.raises(sqlite3.OperationalError, match="Timed out"):
+                    with db.get_connection():
+                        pass
+            assert db._created_connections == 1
+
+            # Returned to the pool, so the next checkout succeeds
+            with db.get_connection():
+                pass
+        finally:
+            db.close_all()
+
+    def test_memory_database_uses_one_connection(self):
+        """Test an in-memory database keeps all queries on one database"""
+        db = DatabaseManager(db_path=Path(":memory:"))
+        try:
+            assert db._pool_size == 1
+            assert db.init_database()
+            user_id = db.create_user("tester")
+
+            assert db.get_user(user_id)["name"] == "tester"
+            assert db._created_connections == 1
+        finally:
+            db.close_all()
+
+    def _create_v1_database(self, db_path, next_reviews):
+        """Write a version 1 database whose next_review values are ISO text"""
+        v1_schema = DatabaseManager.SQL_CREATE_TABLES.replace(
+            "next_review INTEGER,  -- unix epoch seconds", "next_review TIMESTAMP,"
+        )
+        assert v1_schema != DatabaseManager.SQL_CREATE_TABLES
+
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(v1_schema)
+        conn.execute("INSERT INTO users (id, name) VALUES (1, 'tester')")
+        for i, next_review in enumerate(next_reviews, 1):
+            conn.execute(
+                "INSERT INTO vocabularies (id, word, definition) VALUES (?, ?, 'def')",
+                (i, f"word{i}")
+            )
+            conn.execute(
+                "INSERT INTO word_records"
+                " (id, user_id, vocabulary_id, status, state, next_review)"
+                " VALUES (?, 1, ?, 'medium', 'learning', ?)",
+                (i, i, next_review)
+            )
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+    def test_migrate_iso_next_review(self, db_path, local_tz):
+        """Test ISO text next_review values become local-time epoch seconds"""
+        self._create_v1_database(db_path, [
+            "2024-01-10T08:30:00.123456",
+            "2024-01-10T08:30:00",
+            None,
+        ])
+
+        db = DatabaseManager(db_path=db_path)
+        try:
+            assert db.init_database()
+        finally:
+            db.close_all()
+
+        conn = sqlite3.connect(str(db_path))
+        rows = conn.execute("SELECT next_review, typeof(next_review) FROM word_records ORDER BY id").fetchall()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+
+        # 08:30 in UTC+8 is 00:30 UTC; fractional seconds are dropped
+        assert rows == [(1704846600, "integer"), (1704846600, "integer"), (None, "null")]
+        assert version == DatabaseManager.SCHEMA_VERSION == 2
+
+    def test_due_words_after_migration(self, db_path, local_tz):
+        """Test due-word queries count migrated rows by their real due time"""
+        now = datetime.now()
+        self._create_v1_database(db_path, [
+            (now - timedelta(days=2)).isoformat(),
+            # Due an hour ago: wrongly counted as not yet due if the text were
+            # compared against UTC, or if local time were taken for UTC
+            (now - timedelta(hours=1)).isoformat(),
+            (now + timedelta(hours=1)).isoformat(),
+            (now + timedelta(days=2)).isoformat(),
+            None,
+        ])
+
+        db = DatabaseManager(db_path=db_path)
+        try:
+            assert db.init_database()
+            due = db.get_due_words(1)
+            stats = db.get_user_stats(1)
+        finally:
+            db.close_all()
+
+        assert [row["id"] for row in due] == [1, 2]
+        assert stats["due_for_review"] == 2
+        assert stats["total_studied"] == 5
+
+    def test_init_database_current_version(self, db_path):
+        """Test a fresh database is stamped with the schema version"""
+        db = DatabaseManager(db_path=db_path)
+        try:
+            assert db.init_database()
+            assert db.init_database()  # Second run takes the fast path
+            with db.get_connection() as conn:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            db.close_all()
+
+        assert version == DatabaseManager.SCHEMA_VERSION
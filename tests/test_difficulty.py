@@ -42,12 +42,32 @@ class TestDifficultyAdapter:
         assert adapter.difficulty_to_elo(0) == 600  # Clamped to 1
         assert adapter.difficulty_to_elo(11) == 2400  # Clamped to 10
 
+    def test_difficulty_to_elo_float_input(self, adapter):
+        """Test numeric non-int difficulties are still accepted"""
+        assert adapter.difficulty_to_elo(5.0) == 1400
+        assert adapter.difficulty_to_elo(10.5) == 2400  # Clamped to 10
+        assert adapter.difficulty_to_elo(5.5) == 1000  # Between levels
+        assert adapter.expected_score(1400, 5.0) == pytest.approx(0.5)
+        assert adapter.batch_update(1400, [(5.0, True)]) == \
+            adapter.batch_update(1400, [(5, True)])
+
     def test_elo_to_difficulty_conversion(self, adapter):
         """Test converting ELO ratings to difficulty levels"""
         assert adapter.elo_to_difficulty(600) == 1
         assert adapter.elo_to_difficulty(1400) == 5
         assert adapter.elo_to_difficulty(2400) == 10
 
+    def test_elo_to_difficulty_matches_nearest_table_entry(self, adapter):
+        """Test arithmetic conversion against a nearest-entry table search"""
+        table = adapter.DIFFICULTY_TO_ELO
+        for elo in range(0, 3001, 25):
+            # Ties go to the easier difficulty
+            nearest = min(table, key=lambda d: (abs(table[d] - elo), d))
+            assert adapter.elo_to_difficulty(elo) == nearest
+            assert adapter.elo_to_difficulty(elo + 0.5) == min(
+                table, key=lambda d: (abs(table[d] - elo - 0.5), d)
+            )
+
     def test_expected_score_equal_ratings(self, adapter):
         """Test expected score when user and word ratings are equal"""
         # Equal ratings should give 50% probability
@@ -68,6 +88,14 @@ class TestDifficultyAdapter:
         assert expected < 0.5
         assert expected > 0.0
 
+    def test_expected_score_matches_elo_formula(self, adapter):
+        """Test expected score against the reference ELO formula"""
+        for difficulty in range(1, 11):
+            word_rating = adapter.difficulty_to_elo(difficulty)
+            reference = 1.0 / (1.0 + 10 ** ((word_rating - 1234.5) / 400))
+            expected = adapter.expected_score(user_rating=1234.5, word_difficulty=difficulty)
+            assert expected == pytest.approx(reference, rel=1e-12)
+
     def test_update_user_rating_correct_easy_word(self, adapter):
         """Test rating update after correct answer on easy word"""
         # User 1000, difficulty 1 (ELO 600) - should be very likely correct
@@ -140,6 +168,14 @@ class TestDifficultyAdapter:
         difficulty = adapter.recommend_difficulty(user_rating=700, target_success_rate=0.7)
         assert difficulty <= 2
 
+    def test_recommend_difficulty_batch_matches_scalar(self, adapter):
+        """Test batch recommendations equal per-rating recommendations"""
+        ratings = [r * 12.5 for r in range(0, 240)]
+
+        for target in (None, 0.5, 0.7, 0.9):
+            expected = [adapter.recommend_difficulty(r, target) for r in ratings]
+            assert adapter.recommend_difficulty_batch(ratings, target) == expected
+
     def test_batch_update(self, adapter):
         """Test batch rating update"""
         results = [
@@ -154,6 +190,17 @@ class TestDifficultyAdapter:
         # Should be slightly higher overall
         assert isinstance(new_rating, float)
 
+    def test_batch_update_matches_sequential_updates(self, adapter):
+        """Test batch update equals applying single updates in order"""
+        results = [(d % 10 + 1, d % 3 != 0) for d in range(50)]
+
+        expected_rating = 1000.0
+        for difficulty, is_correct in results:
+            expected_rating = adapter.update_user_rating(expected_rating, difficulty, is_correct)
+
+        new_rating = adapter.batch_update(current_rating=1000.0, results=results)
+        assert new_rating == pytest.approx(expected_rating, rel=1e-9)
+
     def test_calculate_session_rating(self, adapter):
         """Test session-based rating calculation"""
         new_rating = adapter.calculate_session_rating(
@@ -257,3 +304,11 @@ class TestDifficultyAdapter:
 
         assert should_adjust is False
         assert direction == "none"
+
+    def test_should_adjust_difficulty_with_correct_count(self, adapter):
+        """Test that a caller-supplied correct count matches counting the list"""
+        results = [True, True, False, True, True, True, True, True, True, True]
+
+        assert adapter.should_adjust_difficulty(results, correct_count=9) == \
+            adapter.should_adjust_difficulty(results)
+        assert adapter.should_adjust_difficulty(results, correct_count=4) == (True, "easier")
@@ -0,0 +1,112 @@
+"""
+Unit tests for notebook models
+
+Tests the mistake / new word book collections including:
+- Entry lookup by word record ID
+- Adding and removing entries
+- Index consistency with the entry list
+"""
+
+import copy
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from src.models.notebook import Notebook, MistakeBook, MistakeEntry, NewWordBook, NotebookType
+
+
+class TestNotebook:
+    """Test suite for Notebook class"""
+
+    def _entry(self, entry_id: int, word_record_id: int, days_ago: int = 0) -> MistakeEntry:
+        return MistakeEntry(
+            id=entry_id,
+            user_id=1,
+            word_record_id=word_record_id,
+            created_at=datetime(2024, 1, 10) - timedelta(days=days_ago),
+        )
+
+    def test_add_entry_rejects_duplicate(self):
+        """Test adding an entry for an already present word record"""
+        notebook = Notebook(user_id=1)
+
+        assert notebook.add_entry(self._entry(1, 10))
+        assert not notebook.add_entry(self._entry(2, 10))
+        assert len(notebook) == 1
+        assert notebook.get_entry_by_word_record(10).id == 1
+
+    def test_remove_entry_promotes_later_duplicate(self):
+        """Test removing a repeated word record ID indexes the next entry"""
+        first = self._entry(1, 10)
+        other = self._entry(2, 20)
+        duplicate = self._entry(3, 10)
+        notebook = Notebook(user_id=1, entries=[first, other, duplicate])
+
+        assert notebook.get_entry_by_word_record(10) is first
+        assert notebook.remove_entry(10)
+        assert notebook.entries == [other, duplicate]
+        assert notebook.get_entry_by_word_record(10) is duplicate
+
+        assert notebook.remove_entry(10)
+        assert notebook.get_entry_by_word_record(10) is None
+        assert notebook.entries == [other]
+
+    def test_remove_missing_entry(self):
+        """Test removing an unknown word record ID"""
+        notebook = Notebook(user_id=1, entries=[self._entry(1, 10)])
+
+        assert not notebook.remove_entry(99)
+        assert len(notebook) == 1
+
+    def test_remove_entry_after_external_mutation(self):
+        """Test removal when the entry list was changed directly"""
+        notebook = Notebook(user_id=1, entries=[self._entry(1, 4), self._entry(2, 5)])
+        notebook.entries.clear()
+
+        assert not notebook.remove_entry(4)
+        assert notebook.get_entry_by_word_record(4) is None
+        assert notebook.get_entry_by_word_record(5) is not None
+
+    def test_sort_by_date_reindexes_duplicates(self):
+        """Test the index follows the first entry per ID after sorting"""
+        older = self._entry(1, 10, days_ago=5)
+        newer = self._entry(2, 10, days_ago=1)
+        notebook = Notebook(user_id=1, entries=[older, newer])
+
+        notebook.sort_by_date(descending=True)
+
+        assert notebook.entries == [newer, older]
+        assert notebook.get_entry_by_word_record(10) is newer
+        assert notebook.remove_entry(10)
+        assert notebook.entries == [older]
+        assert notebook.get_entry_by_word_record(10) is older
+
+    def test_to_dict(self):
+        """Test notebook serialization"""
+        notebook = Notebook(user_id=1, entries=[self._entry(1, 10)])
+
+        data = notebook.to_dict()
+
+        assert data["notebook_type"] == NotebookType.MISTAKE.value
+        assert data["total_entries"] == 1
+        assert data["entries"][0]["word_record_id"] == 10
+
+    def test_notebook_asdict_has_only_data_fields(self):
+        """Test dataclasses.asdict leaves out the lookup index"""
+        notebook = Notebook(user_id=1, entries=[self._entry(1, 10)])
+
+        assert list(asdict(notebook)) == ["user_id", "entries", "notebook_type"]
+
+    def test_copy_keeps_index(self):
+        """Test copies look entries up in their own list"""
+        notebook = Notebook(user_id=1, entries=[self._entry(1, 10)])
+
+        clone = copy.deepcopy(notebook)
+        assert clone.get_entry_by_word_record(10) is clone.entries[0]
+        assert clone.remove_entry(10)
+        assert len(notebook) == 1
+
+    def test_specialized_books_have_no_dict(self):
+        """Test MistakeBook and NewWordBook stay slotted"""
+        for book in (MistakeBook(user_id=1), NewWordBook(user_id=1)):
+            assert not hasattr(book, "__dict__")
+            assert book.add_entry(self._entry(1, 10))
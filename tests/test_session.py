@@ -0,0 +1,91 @@
+"""
+Unit tests for session models
+
+Tests the study session and test question records including:
+- Vocabulary membership tracking
+- Answer checking
+"""
+
+import copy
+import pickle
+from dataclasses import asdict
+
+from src.models.session import StudySession, SessionType
+from src.models.session import TestQuestion as Question  # Not collected as a test class
+
+
+class TestStudySession:
+    """Test suite for StudySession class"""
+
+    def test_asdict_has_only_data_fields(self):
+        """Test dataclasses.asdict sees only the session's data"""
+        session = StudySession(id=1, user_id=1, session_type=SessionType.TEST)
+        session.to_dict()
+
+        assert list(asdict(session)) == [
+            "id", "user_id", "session_type", "start_time", "end_time",
+            "words_studied", "words_correct", "total_attempts", "vocabulary_ids",
+        ]
+
+    def test_add_vocabulary_skips_duplicates(self):
+        """Test each vocabulary ID is recorded once"""
+        session = StudySession(id=1, user_id=1, vocabulary_ids=[3])
+
+        session.add_vocabulary(5)
+        session.add_vocabulary(3)
+        session.add_vocabulary(5)
+
+        assert session.vocabulary_ids == [3, 5]
+        assert session.words_studied == 2
+
+    def test_copy_keeps_membership(self):
+        """Test copies and pickles keep working membership checks"""
+        session = StudySession(id=1, user_id=1, vocabulary_ids=[3])
+
+        for clone in (copy.deepcopy(session), pickle.loads(pickle.dumps(session))):
+            clone.add_vocabulary(3)
+            clone.add_vocabulary(4)
+            assert clone.vocabulary_ids == [3, 4]
+        assert session.vocabulary_ids == [3]
+
+
+class TestTestQuestion:
+    """Test suite for TestQuestion class"""
+
+    def _question(self, correct_answer: str) -> Question:
+        return Question(
+            vocabulary_id=1,
+            question_type="spelling",
+            question="放弃",
+            correct_answer=correct_answer,
+        )
+
+    def test_answer_ignores_case_and_whitespace(self):
+        """Test answers are compared case-insensitively after stripping"""
+        question = self._question(" Abandon ")
+
+        assert question.answer("  ABANDON", time_taken=3)
+        assert question.is_correct
+        assert question.time_taken == 3
+        assert not question.answer("abandoned")
+        assert question.user_answer == "abandoned"
+
+    def test_answer_uses_casefold(self):
+        """Test case folding beyond lower() (German sharp s)"""
+        assert self._question("Straße").answer("STRASSE")
+
+    def test_answer_after_correct_answer_change(self):
+        """Test answers are checked against the current correct answer"""
+        question = self._question("abandon")
+        question.correct_answer = "desert"
+
+        assert question.answer("Desert")
+
+    def test_asdict_has_only_data_fields(self):
+        """Test dataclasses.asdict sees only the question's data"""
+        question = self._question("abandon")
+
+        assert list(asdict(question)) == [
+            "vocabulary_id", "question_type", "question", "correct_answer",
+            "user_answer", "is_correct", "time_taken",
+        ]
@@ -12,7 +12,10 @@ import pytest
 from datetime import datetime, timedelta
 
 from src.core.srs import SRSEngine
+from src.models.user import User
 from src.models.word_record import MemoryStatus, WordState, WordRecord
+from src.infrastructure.database import DatabaseManager
+from src.services.study_manager import StudyManager
 
 
 class TestSRSEngine:
@@ -144,6 +147,81 @@ class TestSRSEngine:
         # Medium may slightly decrease or maintain easiness
         assert 1.3 <= easiness <= 2.5
 
+    def test_calculate_next_review_batch_matches_single(self, srs_engine):
+        """Test batch scheduling equals scheduling each word separately"""
+        statuses = [MemoryStatus.EASY, MemoryStatus.MEDIUM, MemoryStatus.HARD, MemoryStatus.UNKNOWN]
+        intervals = [0, 1, 6, 15, 40, 3000] * 4
+        easiness = [1.3, 2.5, 2.95, 1.5, 2.0, 3.0] * 4
+        repetitions = [0, 1, 2, 3, 5, 9] * 4
+        feedbacks = [statuses[i % 4] for i in range(len(intervals))]
+
+        batch = srs_engine.calculate_next_review_batch(intervals, easiness, repetitions, feedbacks)
+
+        assert len(batch) == len(intervals)
+        for args, (interval, ef, reps, next_review) in zip(
+            zip(intervals, easiness, repetitions, feedbacks), batch
+        ):
+            exp_interval, exp_ef, exp_reps, exp_review = srs_engine.calculate_next_review(*args)
+            assert (interval, ef, reps) == (exp_interval, exp_ef, exp_reps)
+            assert abs(next_review - exp_review) < timedelta(seconds=5)
+
+    def test_update_records_batch_matches_study_manager(self, srs_engine, tmp_path):
+        """Test batch record updates equal StudyManager's per-word answers"""
+        db = DatabaseManager(db_path=tmp_path / "study.db")
+        assert db.init_database()
+        user = User(id=db.create_user("tester"), name="tester")
+        vocab_ids = [
+            db.insert_vocabulary({"word": f"word{i}", "definition": "def", "difficulty": 3})
+            for i in range(4)
+        ]
+        manager = StudyManager(db_manager=db, srs_engine=srs_engine)
+
+        E, M, H = MemoryStatus.EASY, MemoryStatus.MEDIUM, MemoryStatus.HARD
+        # One row per round, one column per word; covers EASY runs that are
+        # completed, interrupted and restarted
+        rounds = [
+            [E, E, M, H],
+            [E, H, E, H],
+            [E, E, E, E],
+            [E, E, M, E],
+            [E, E, E, E],
+        ]
+
+        records = [WordRecord(id=None, user_id=user.id, vocabulary_id=v) for v in vocab_ids]
+        try:
+            for feedbacks in rounds:
+                srs_engine.update_records_batch(records, feedbacks)
+                for vocab_id, feedback in zip(vocab_ids, feedbacks):
+                    manager.submit_answer(user, vocab_id, feedback)
+
+            expected = [
+                WordRecord.from_dict(db.get_or_create_word_record(user.id, v))
+                for v in vocab_ids
+            ]
+        finally:
+            db.close_all()
+
+        for got, exp in zip(records, expected):
+            assert (got.status, got.state, got.consecutive_count) == \
+                (exp.status, exp.state, exp.consecutive_count)
+            assert (got.interval, got.repetitions) == (exp.interval, exp.repetitions)
+            assert got.easiness == pytest.approx(exp.easiness)
+            assert abs(got.next_review - exp.next_review) < timedelta(seconds=5)
+            assert got.last_review is not None
+        # Two EASY in a row reach REVIEW; the count then restarts there
+        assert [(r.state, r.consecutive_count) for r in records] == [
+            (WordState.REVIEW, 2), (WordState.REVIEW, 1),
+            (WordState.REVIEW, 1), (WordState.REVIEW, 1),
+        ]
+
+    def test_update_records_batch_length_mismatch(self, srs_engine):
+        """Test records and feedbacks must line up"""
+        records = [WordRecord(id=1, user_id=1, vocabulary_id=1)]
+
+        with pytest.raises(ValueError):
+            srs_engine.update_records_batch(records, [MemoryStatus.EASY, MemoryStatus.HARD])
+        assert records[0].status == MemoryStatus.UNKNOWN
+
     def test_get_due_records_empty(self, srs_engine):
         """Test getting due records from empty list"""
         due = srs_engine.get_due_records([])
@@ -284,6 +362,26 @@ class TestSRSEngine:
         assert load[1] == 1  # Tomorrow: 1 due
         assert load[2] == 0  # Day 2: none
 
+    def test_estimate_review_load_buckets_by_day(self, srs_engine):
+        """Test review load counts each record in its calendar day"""
+        now = datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        offsets = [-2, 0, 0.5, 1, 1.99, 3, 3, 6.5, 7, 8, 20]
+
+        records = [
+            WordRecord(
+                id=i, user_id=1, vocabulary_id=i,
+                next_review=midnight + timedelta(days=offset),
+                status=MemoryStatus.EASY
+            )
+            for i, offset in enumerate(offsets)
+        ]
+        records.append(WordRecord(id=99, user_id=1, vocabulary_id=99))
+
+        load = srs_engine.estimate_review_load(records, days_ahead=7)
+
+        assert load == {0: 2, 1: 2, 2: 0, 3: 2, 4: 0, 5: 0, 6: 1, 7: 1}
+
     def test_max_interval_clamping(self, srs_engine):
         """Test that intervals don't exceed maximum to prevent overflow"""
         # Simulate many successful reviews
@@ -0,0 +1,95 @@
+"""
+Unit tests for Word Learning State Machine
+
+Tests the state transition logic including:
+- Consecutive EASY requirements
+- Consecutive count resets
+- Per-word counts passed through next_state
+- Transition history
+"""
+
+import pytest
+
+from src.core.state_machine import WordStateMachine
+from src.models.word_record import MemoryStatus, WordState
+
+
+class TestWordStateMachine:
+    """Test suite for WordStateMachine class"""
+
+    @pytest.fixture
+    def machine(self):
+        """Create a fresh state machine for each test"""
+        return WordStateMachine()
+
+    def test_new_word_enters_learning(self, machine):
+        """Test any feedback moves a NEW word to LEARNING"""
+        for feedback in (MemoryStatus.EASY, MemoryStatus.MEDIUM, MemoryStatus.HARD):
+            assert machine.next_state(WordState.NEW, feedback) == (WordState.LEARNING, 0)
+
+    def test_learning_needs_two_easy(self, machine):
+        """Test LEARNING moves to REVIEW on the second consecutive EASY"""
+        state, count = machine.next_state(WordState.LEARNING, MemoryStatus.EASY, 0)
+        assert (state, count) == (WordState.LEARNING, 1)
+
+        state, count = machine.next_state(state, MemoryStatus.EASY, count)
+        assert (state, count) == (WordState.REVIEW, 0)
+
+    def test_review_needs_three_easy(self, machine):
+        """Test REVIEW moves to MASTERED on the third consecutive EASY"""
+        state, count = WordState.REVIEW, 0
+        for expected in (1, 2):
+            state, count = machine.next_state(state, MemoryStatus.EASY, count)
+            assert (state, count) == (WordState.REVIEW, expected)
+
+        assert machine.next_state(state, MemoryStatus.EASY, count) == (WordState.MASTERED, 0)
+
+    def test_hard_resets_count(self, machine):
+        """Test a HARD answer resets the consecutive EASY count"""
+        state, count = machine.next_state(WordState.LEARNING, MemoryStatus.EASY, 0)
+        assert count == 1
+
+        state, count = machine.next_state(state, MemoryStatus.HARD, count)
+        assert (state, count) == (WordState.LEARNING, 0)
+
+        # The run starts over, so one more EASY is not enough
+        state, count = machine.next_state(state, MemoryStatus.EASY, count)
+        assert (state, count) == (WordState.LEARNING, 1)
+
+    def test_medium_resets_count_in_review(self, machine):
+        """Test a MEDIUM answer in REVIEW keeps the state but resets the count"""
+        assert machine.next_state(WordState.REVIEW, MemoryStatus.MEDIUM, 2) == (WordState.REVIEW, 0)
+
+    def test_hard_in_review_drops_to_learning(self, machine):
+        """Test a HARD answer in REVIEW drops back to LEARNING"""
+        assert machine.next_state(WordState.REVIEW, MemoryStatus.HARD, 2) == (WordState.LEARNING, 0)
+
+    def test_counts_do_not_interfere_between_words(self, machine):
+        """Test interleaved words keep their own consecutive counts"""
+        word_a = machine.next_state(WordState.LEARNING, MemoryStatus.EASY, 0)
+        word_b = machine.next_state(WordState.LEARNING, MemoryStatus.HARD, 0)
+        assert word_a == (WordState.LEARNING, 1)
+        assert word_b == (WordState.LEARNING, 0)
+
+        # Word B's first EASY must not complete word A's run, nor the reverse
+        word_b = machine.next_state(word_b[0], MemoryStatus.EASY, word_b[1])
+        assert word_b == (WordState.LEARNING, 1)
+
+        word_a = machine.next_state(word_a[0], MemoryStatus.EASY, word_a[1])
+        assert word_a == (WordState.REVIEW, 0)
+
+        word_b = machine.next_state(word_b[0], MemoryStatus.EASY, word_b[1])
+        assert word_b == (WordState.REVIEW, 0)
+
+    def test_state_history(self, machine):
+        """Test transitions are recorded oldest first"""
+        machine.next_state(WordState.NEW, MemoryStatus.HARD)
+        machine.next_state(WordState.LEARNING, MemoryStatus.MEDIUM)
+
+        assert machine.get_state_history() == [
+            (WordState.NEW, MemoryStatus.HARD),
+            (WordState.LEARNING, MemoryStatus.MEDIUM),
+        ]
+
+        machine.reset()
+        assert machine.state_history == []
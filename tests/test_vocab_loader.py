@@ -0,0 +1,145 @@
+"""
+Unit tests for the vocabulary loader
+
+Tests the parsed-vocabulary caching including:
+- In-process memo hits for unchanged files
+- Re-parsing after the file's mtime or size changes
+- Ignoring corrupt or stale pickle caches
+- Pickle caches only for files under the vocabulary directory
+- Independent copies for load_vocabulary callers
+"""
+
+import json
+import os
+
+import pytest
+
+from src.infrastructure.vocab_loader import VocabLoader
+
+
+class TestVocabLoader:
+    """Test suite for VocabLoader caching"""
+
+    @pytest.fixture
+    def vocab_file(self, tmp_path):
+        """Write a small JSON vocabulary file"""
+        vocab_dir = tmp_path / "vocab"
+        vocab_dir.mkdir()
+        path = vocab_dir / "basic.json"
+        self._write_words(path, ["apple", "banana"])
+        return path
+
+    def _write_words(self, path, words):
+        data = {
+            "meta": {"name": "basic"},
+            "words": [{"word": w, "definition": f"{w} (def)", "difficulty": 3} for w in words],
+        }
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def _loader(self, vocab_file, tmp_path, monkeypatch):
+        """Create a loader that counts how often it parses JSON"""
+        loader = VocabLoader(vocab_dir=vocab_file.parent, cache_dir=tmp_path / "cache")
+        loader.parse_count = 0
+        parse = loader._load_json
+
+        def counting_parse(path):
+            loader.parse_count += 1
+            return parse(path)
+
+        monkeypatch.setattr(loader, "_load_json", counting_parse)
+        return loader
+
+    def test_second_load_hits_memo(self, vocab_file, tmp_path, monkeypatch):
+        """Test loading an unchanged file twice parses it once"""
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+
+        first = loader.load_vocabulary("basic.json")
+        second = loader.load_vocabulary("basic.json")
+
+        assert loader.parse_count == 1
+        assert first == second
+        assert [w["word"] for w in first] == ["apple", "banana"]
+
+    def test_pickle_cache_used_by_new_loader(self, vocab_file, tmp_path, monkeypatch):
+        """Test a fresh loader reads the words from the pickle cache"""
+        self._loader(vocab_file, tmp_path, monkeypatch).load_vocabulary("basic.json")
+        assert list((tmp_path / "cache").glob("basic.*.pkl"))
+
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+        words = loader.load_vocabulary("basic.json")
+
+        assert loader.parse_count == 0
+        assert [w["word"] for w in words] == ["apple", "banana"]
+
+    def test_outside_file_not_cached_on_disk(self, vocab_file, tmp_path, monkeypatch):
+        """Test a file outside vocab_dir is memoized but gets no pickle cache"""
+        outside = tmp_path / "import.json"
+        self._write_words(outside, ["cherry"])
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+
+        loader.load_vocabulary(str(outside))
+        words = loader.load_vocabulary(str(outside))
+
+        assert loader.parse_count == 1
+        assert [w["word"] for w in words] == ["cherry"]
+        assert not (tmp_path / "cache").exists()
+
+    def test_changed_mtime_reparses(self, vocab_file, tmp_path, monkeypatch):
+        """Test touching the file invalidates the memo and the pickle cache"""
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+        loader.load_vocabulary("basic.json")
+
+        stat = vocab_file.stat()
+        os.utime(vocab_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        loader.load_vocabulary("basic.json")
+        assert loader.parse_count == 2
+
+        fresh = self._loader(vocab_file, tmp_path, monkeypatch)
+        fresh.load_vocabulary("basic.json")
+        assert fresh.parse_count == 0  # Cache rewritten for the new mtime
+
+    def test_changed_size_reparses(self, vocab_file, tmp_path, monkeypatch):
+        """Test rewriting the file with the same mtime still re-parses"""
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+        loader.load_vocabulary("basic.json")
+
+        stat = vocab_file.stat()
+        self._write_words(vocab_file, ["apple", "banana", "cherry"])
+        os.utime(vocab_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        words = loader.load_vocabulary("basic.json")
+
+        assert loader.parse_count == 2
+        assert [w["word"] for w in words] == ["apple", "banana", "cherry"]
+
+    def test_corrupt_cache_ignored(self, vocab_file, tmp_path, monkeypatch):
+        """Test an unreadable pickle cache falls back to parsing"""
+        self._loader(vocab_file, tmp_path, monkeypatch).load_vocabulary("basic.json")
+        (cache_path,) = (tmp_path / "cache").glob("basic.*.pkl")
+        cache_path.write_bytes(b"not a pickle")
+
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+        words = loader.load_vocabulary("basic.json")
+
+        assert loader.parse_count == 1
+        assert [w["word"] for w in words] == ["apple", "banana"]
+
+    def test_stale_cache_ignored(self, vocab_file, tmp_path, monkeypatch):
+        """Test a pickle cache written under an older CACHE_VERSION is not used"""
+        self._loader(vocab_file, tmp_path, monkeypatch).load_vocabulary("basic.json")
+
+        monkeypatch.setattr(VocabLoader, "CACHE_VERSION", VocabLoader.CACHE_VERSION + 1)
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+        loader.load_vocabulary("basic.json")
+        assert loader.parse_count == 1
+
+    def test_load_vocabulary_returns_copies(self, vocab_file, tmp_path, monkeypatch):
+        """Test changes to returned words do not reach the cached list"""
+        loader = self._loader(vocab_file, tmp_path, monkeypatch)
+
+        words = loader.load_vocabulary("basic.json")
+        words[0]["word"] = "changed"
+        words.append({"word": "extra"})
+
+        again = loader.load_vocabulary("basic.json")
+        assert loader.parse_count == 1
+        assert [w["word"] for w in again] == ["apple", "banana"]
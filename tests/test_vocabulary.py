@@ -0,0 +1,145 @@
+"""
+Unit tests for vocabulary models
+
+Tests the vocabulary set collection including:
+- Filtering words by difficulty
+- Lookup by text and prefix search
+- Lookups staying correct when words is changed directly
+- Keeping the indexes out of the dataclass fields
+"""
+
+import copy
+from dataclasses import asdict
+
+from src.models.vocabulary import Vocabulary, VocabularySet
+
+
+class TestVocabularySet:
+    """Test suite for VocabularySet class"""
+
+    def _vocab(self, vocab_id: int, word: str, difficulty: int = 5) -> Vocabulary:
+        return Vocabulary(id=vocab_id, word=word, definition=f"{word} (def)", difficulty=difficulty)
+
+    def _vocab_set(self, *words: str) -> VocabularySet:
+        return VocabularySet(name="test", words=[self._vocab(i, w) for i, w in enumerate(words, 1)])
+
+    def test_filter_by_difficulty(self):
+        """Test filtering keeps list order across difficulties"""
+        vocab_set = VocabularySet(name="test", words=[
+            self._vocab(1, "a", 7),
+            self._vocab(2, "b", 2),
+            self._vocab(3, "c", 5),
+            self._vocab(4, "d", 9),
+        ])
+
+        assert [v.id for v in vocab_set.filter_by_difficulty(5, 8)] == [1, 3]
+        assert [v.id for v in vocab_set.filter_by_difficulty(1, 10)] == [1, 2, 3, 4]
+        assert vocab_set.filter_by_difficulty(10, 10) == []
+
+    def test_filter_by_difficulty_sees_direct_append(self):
+        """Test words appended to the list directly are filtered"""
+        vocab_set = self._vocab_set("apple")
+        assert len(vocab_set.filter_by_difficulty(5, 5)) == 1
+
+        vocab_set.words.append(self._vocab(2, "banana", 5))
+
+        assert [v.word for v in vocab_set.filter_by_difficulty(5, 5)] == ["apple", "banana"]
+
+    def test_filter_by_difficulty_sees_edited_difficulty(self):
+        """Test changing a word's difficulty moves it between ranges"""
+        vocab_set = self._vocab_set("apple", "banana")
+        assert len(vocab_set.filter_by_difficulty(5, 5)) == 2
+
+        vocab_set.words[0].difficulty = 8
+
+        assert [v.word for v in vocab_set.filter_by_difficulty(5, 5)] == ["banana"]
+        assert [v.word for v in vocab_set.filter_by_difficulty(8, 10)] == ["apple"]
+
+    def test_get_word_by_text(self):
+        """Test lookup is case-insensitive and returns the first duplicate"""
+        vocab_set = self._vocab_set("Apple", "banana")
+        vocab_set.words.append(self._vocab(3, "apple"))
+
+        assert vocab_set.get_word_by_text("APPLE").id == 1
+        assert vocab_set.get_word_by_text("cherry") is None
+
+    def test_get_word_by_text_after_add_and_direct_append(self):
+        """Test lookup finds words added either way after the first lookup"""
+        vocab_set = self._vocab_set("apple")
+        assert vocab_set.get_word_by_text("banana") is None
+
+        vocab_set.add_word(self._vocab(2, "banana"))
+        vocab_set.words.append(self._vocab(3, "cherry"))
+
+        assert vocab_set.get_word_by_text("banana").id == 2
+        assert vocab_set.get_word_by_text("cherry").id == 3
+
+    def test_get_word_by_text_after_words_replaced(self):
+        """Test lookup uses a replacement list of the same length"""
+        vocab_set = self._vocab_set("apple")
+        assert vocab_set.get_word_by_text("apple") is not None
+
+        vocab_set.words = [self._vocab(2, "banana")]
+
+        assert vocab_set.get_word_by_text("apple") is None
+        assert vocab_set.get_word_by_text("banana").id == 2
+
+    def test_prefix_search_ordering(self):
+        """Test matches come back ordered by lower-cased text"""
+        vocab_set = self._vocab_set("apply", "Banana", "apple", "Apt", "ape")
+
+        assert [v.word for v in vocab_set.prefix_search("ap")] == ["ape", "apple", "apply", "Apt"]
+        assert [v.word for v in vocab_set.prefix_search("app")] == ["apple", "apply"]
+        assert vocab_set.prefix_search("c") == []
+
+    def test_prefix_search_limit(self):
+        """Test limit caps the number of matches from the start"""
+        vocab_set = self._vocab_set("apply", "apple", "ape", "banana")
+
+        assert [v.word for v in vocab_set.prefix_search("ap", limit=2)] == ["ape", "apple"]
+        assert vocab_set.prefix_search("ap", limit=0) == []
+        assert len(vocab_set.prefix_search("ap", limit=10)) == 3
+
+    def test_prefix_search_empty_prefix(self):
+        """Test an empty prefix matches every word"""
+        vocab_set = self._vocab_set("cherry", "apple", "banana")
+
+        assert [v.word for v in vocab_set.prefix_search("")] == ["apple", "banana", "cherry"]
+
+    def test_prefix_search_case_insensitive(self):
+        """Test the prefix and the words are compared case-insensitively"""
+        vocab_set = self._vocab_set("Apple", "apricot")
+
+        assert [v.word for v in vocab_set.prefix_search("AP")] == ["Apple", "apricot"]
+        assert [v.word for v in vocab_set.prefix_search("apP")] == ["Apple"]
+
+    def test_prefix_search_after_add_word(self):
+        """Test the index is rebuilt for words added after a search"""
+        vocab_set = self._vocab_set("apple")
+        assert len(vocab_set.prefix_search("a")) == 1
+
+        vocab_set.add_word(self._vocab(2, "avocado"))
+        assert [v.word for v in vocab_set.prefix_search("a")] == ["apple", "avocado"]
+
+        vocab_set.words.append(self._vocab(3, "almond"))
+        assert [v.word for v in vocab_set.prefix_search("a")] == ["almond", "apple", "avocado"]
+
+    def test_asdict_has_only_data_fields(self):
+        """Test dataclasses.asdict leaves out the lookup indexes"""
+        vocab_set = self._vocab_set("apple")
+        vocab_set.get_word_by_text("apple")
+        vocab_set.prefix_search("a")
+
+        assert list(asdict(vocab_set)) == ["name", "words", "description", "level", "version"]
+
+    def test_copy_keeps_lookups(self):
+        """Test a deep copy looks words up in its own list"""
+        vocab_set = self._vocab_set("apple")
+        vocab_set.get_word_by_text("apple")
+
+        clone = copy.deepcopy(vocab_set)
+        clone.add_word(self._vocab(2, "banana"))
+
+        assert clone.get_word_by_text("apple") is clone.words[0]
+        assert [v.word for v in clone.prefix_search("")] == ["apple", "banana"]
+        assert vocab_set.get_word_by_text("banana") is None